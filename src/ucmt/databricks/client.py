@@ -44,18 +44,31 @@ class DatabricksClient:
 
         self._session = builder.getOrCreate()
 
-    def execute(self, sql_statement: str, *args: Any, **kwargs: Any) -> None:
+    def _sql(self, sql_statement: str, params: Optional[dict[str, Any]]) -> Any:
+        """Run a statement, binding named parameter markers (:name) if given."""
         if self._session is None:
             raise RuntimeError("Not connected. Call connect() first.")
-        self._session.sql(sql_statement).collect()
+        if params is None:
+            return self._session.sql(sql_statement)
+        return self._session.sql(sql_statement, args=params)
+
+    def execute(
+        self, sql_statement: str, params: Optional[dict[str, Any]] = None
+    ) -> None:
+        self._sql(sql_statement, params).collect()
 
     def fetchall(
-        self, sql_statement: str, *args: Any, **kwargs: Any
+        self, sql_statement: str, params: Optional[dict[str, Any]] = None
     ) -> list[dict[str, Any]]:
-        if self._session is None:
-            raise RuntimeError("Not connected. Call connect() first.")
-        rows = self._session.sql(sql_statement).collect()
-        return [row.asDict() for row in rows]
+        rows = self._sql(sql_statement, params).collect()
+        if not rows:
+            return []
+        # Every Row from one collect() shares a schema, so zip against the
+        # first row's field names instead of calling asDict() per row.
+        fields = getattr(rows[0], "__fields__", None)
+        if fields is None:
+            return [row.asDict() for row in rows]
+        return [dict(zip(fields, row)) for row in rows]
 
     def close(self) -> None:
         if self._session is not None:
@@ -14,7 +14,7 @@ __all__ = ["MigrationFile", "parse_migration_file", "parse_migrations_dir"]
 MIGRATION_FILENAME_PATTERN = re.compile(r"^V(\d+)__(.+)\.sql$")
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MigrationFile:
     version: int
     name: str
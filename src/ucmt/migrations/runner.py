@@ -16,7 +16,7 @@ __all__ = ["PendingMigration", "plan", "Runner"]
 logger = logging.getLogger(__name__)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PendingMigration:
     version: int
     name: str
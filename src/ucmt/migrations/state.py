@@ -19,12 +19,7 @@ def _validate_identifier(value: str, kind: str) -> str:
     return value
 
 
-def _escape_sql_string(value: str) -> str:
-    """Escape single quotes for SQL string literals."""
-    return value.replace("'", "''")
-
-
-@dataclass
+@dataclass(slots=True)
 class AppliedMigration:
     """Record of a migration that has been executed (successfully or not)."""
 
@@ -208,27 +203,30 @@ class DatabricksMigrationStateStore:
                 )
             return
 
-        def q(v: str) -> str:
-            return "'" + _escape_sql_string(v) + "'"
-
-        error_value = q(error) if error is not None else "NULL"
-        success_value = "true" if success else "false"
         self._client.execute(
             f"INSERT INTO {self.state_table_fqn} "
             f"(version, name, checksum, applied_at, success, error) VALUES "
-            f"({version}, {q(name)}, {q(checksum)}, current_timestamp(), {success_value}, {error_value})"
+            f"(:version, :name, :checksum, current_timestamp(), :success, :error)",
+            {
+                "version": version,
+                "name": name,
+                "checksum": checksum,
+                "success": success,
+                "error": error,
+            },
         )
 
     def has_applied(self, version: int) -> bool:
         rows = self._client.fetchall(
-            f"SELECT version FROM {self.state_table_fqn} WHERE version = {version}"
+            f"SELECT version FROM {self.state_table_fqn} "
+            f"WHERE version = {version} LIMIT 1"
         )
         return len(rows) > 0
 
     def _get_by_version(self, version: int) -> Optional[AppliedMigration]:
         rows = self._client.fetchall(
             f"SELECT version, name, checksum, applied_at, success, error "
-            f"FROM {self.state_table_fqn} WHERE version = {version}"
+            f"FROM {self.state_table_fqn} WHERE version = {version} LIMIT 1"
         )
         if not rows:
             return None
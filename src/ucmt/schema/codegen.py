@@ -1,6 +1,7 @@
 """Generate SQL migrations from schema changes."""
 
 from datetime import datetime
+from typing import ClassVar
 
 from ucmt.exceptions import CodegenError, UnsupportedSchemaChangeError
 from ucmt.schema.diff import SchemaChange
@@ -62,25 +63,10 @@ class MigrationGenerator:
 
     def _generate_sql(self, change: SchemaChange) -> str:
         """Generate SQL for a single change."""
-        generators = {
-            ChangeType.CREATE_TABLE: self._gen_create_table,
-            ChangeType.DROP_TABLE: self._gen_drop_table,
-            ChangeType.ADD_COLUMN: self._gen_add_column,
-            ChangeType.DROP_COLUMN: self._gen_drop_column,
-            ChangeType.ALTER_COLUMN_TYPE: self._gen_alter_column_type,
-            ChangeType.ALTER_COLUMN_NULLABILITY: self._gen_alter_nullability,
-            ChangeType.ALTER_COLUMN_DEFAULT: self._gen_alter_default,
-            ChangeType.ADD_CHECK_CONSTRAINT: self._gen_add_check,
-            ChangeType.DROP_CHECK_CONSTRAINT: self._gen_drop_check,
-            ChangeType.SET_PRIMARY_KEY: self._gen_set_pk,
-            ChangeType.DROP_PRIMARY_KEY: self._gen_drop_pk,
-            ChangeType.ALTER_CLUSTERING: self._gen_alter_clustering,
-            ChangeType.ALTER_TABLE_PROPERTIES: self._gen_alter_properties,
-        }
-        generator = generators.get(change.change_type)
-        if not generator:
+        name = self._GENERATORS.get(change.change_type)
+        if name is None:
             raise CodegenError(f"No generator for {change.change_type}")
-        return generator(change)
+        return getattr(self, name)(change)
 
     def _fqn(self, table_name: str) -> str:
         """Generate fully-qualified table name with variables."""
@@ -245,3 +231,20 @@ class MigrationGenerator:
         fqn = self._fqn(change.table_name)
 
         return f"-- DROP TABLE IF EXISTS {fqn};"
+
+    # Method names, not functions, so subclass overrides of _gen_* still apply.
+    _GENERATORS: ClassVar[dict[ChangeType, str]] = {
+        ChangeType.CREATE_TABLE: "_gen_create_table",
+        ChangeType.DROP_TABLE: "_gen_drop_table",
+        ChangeType.ADD_COLUMN: "_gen_add_column",
+        ChangeType.DROP_COLUMN: "_gen_drop_column",
+        ChangeType.ALTER_COLUMN_TYPE: "_gen_alter_column_type",
+        ChangeType.ALTER_COLUMN_NULLABILITY: "_gen_alter_nullability",
+        ChangeType.ALTER_COLUMN_DEFAULT: "_gen_alter_default",
+        ChangeType.ADD_CHECK_CONSTRAINT: "_gen_add_check",
+        ChangeType.DROP_CHECK_CONSTRAINT: "_gen_drop_check",
+        ChangeType.SET_PRIMARY_KEY: "_gen_set_pk",
+        ChangeType.DROP_PRIMARY_KEY: "_gen_drop_pk",
+        ChangeType.ALTER_CLUSTERING: "_gen_alter_clustering",
+        ChangeType.ALTER_TABLE_PROPERTIES: "_gen_alter_properties",
+    }
@@ -1,13 +1,13 @@
 """Compare schemas and generate changes."""
 
 from dataclasses import dataclass, field
-from typing import Any, Optional
+from typing import Any, ClassVar, Optional
 
 from ucmt.schema.models import Column, Schema, Table
 from ucmt.types import ChangeType
 
 
-@dataclass
+@dataclass(slots=True)
 class SchemaChange:
     """Represents a single schema change."""
 
@@ -21,7 +21,19 @@ class SchemaChange:
 
 
 class SchemaDiffer:
-    """Compare two schemas and generate list of changes."""
+    """Compare two schemas and generate list of changes.
+
+    Holds no per-diff state, so one instance can be shared and reused.
+    """
+
+    __slots__ = ()
+
+    _WIDENING_PATHS: ClassVar[dict[str, frozenset[str]]] = {
+        "TINYINT": frozenset({"SMALLINT", "INT", "BIGINT"}),
+        "SMALLINT": frozenset({"INT", "BIGINT"}),
+        "INT": frozenset({"BIGINT"}),
+        "FLOAT": frozenset({"DOUBLE"}),
+    }
 
     def diff(self, source: Schema, target: Schema) -> list[SchemaChange]:
         """Compare source (current DB) to target (declared) and return changes."""
@@ -67,10 +79,10 @@ class SchemaDiffer:
         changes: list[SchemaChange] = []
         table_name = source.name
 
-        source_cols = {c.name: c for c in source.columns}
-        target_cols = {c.name: c for c in target.columns}
+        source_cols = source.columns_by_name
+        target_cols = target.columns_by_name
 
-        for col_name in set(target_cols) - set(source_cols):
+        for col_name in target_cols.keys() - source_cols.keys():
             col = target_cols[col_name]
             changes.append(
                 SchemaChange(
@@ -80,7 +92,7 @@ class SchemaDiffer:
                 )
             )
 
-        for col_name in set(source_cols) - set(target_cols):
+        for col_name in source_cols.keys() - target_cols.keys():
             changes.append(
                 SchemaChange(
                     change_type=ChangeType.DROP_COLUMN,
@@ -91,7 +103,7 @@ class SchemaDiffer:
                 )
             )
 
-        for col_name in set(source_cols) & set(target_cols):
+        for col_name in source_cols.keys() & target_cols.keys():
             changes.extend(
                 self._diff_column(
                     table_name, source_cols[col_name], target_cols[col_name]
@@ -106,8 +118,8 @@ class SchemaDiffer:
         """Compare two columns and return changes."""
         changes: list[SchemaChange] = []
 
-        if source.type.upper() != target.type.upper():
-            valid, error = self._validate_type_change(source.type, target.type)
+        if source.normalized_type != target.normalized_type:
+            valid, error = self._validate_type_change(source, target)
             changes.append(
                 SchemaChange(
                     change_type=ChangeType.ALTER_COLUMN_TYPE,
@@ -151,33 +163,28 @@ class SchemaDiffer:
         return changes
 
     def _validate_type_change(
-        self, from_type: str, to_type: str
+        self, source: Column, target: Column
     ) -> tuple[bool, Optional[str]]:
         """Validate if a type change is supported in Delta Lake."""
-        widening_allowed = {
-            ("INT", "BIGINT"),
-            ("SMALLINT", "INT"),
-            ("SMALLINT", "BIGINT"),
-            ("TINYINT", "SMALLINT"),
-            ("TINYINT", "INT"),
-            ("TINYINT", "BIGINT"),
-            ("FLOAT", "DOUBLE"),
-        }
+        from_type, to_type = source.type, target.type
+        from_upper = source.normalized_type
+        to_upper = target.normalized_type
+        if from_upper == to_upper:
+            return True, None
 
-        from_upper = from_type.upper().split("(")[0]
-        to_upper = to_type.upper().split("(")[0]
+        from_base = from_upper.partition("(")[0]
+        to_base = to_upper.partition("(")[0]
 
-        if (from_upper, to_upper) in widening_allowed:
+        allowed = self._WIDENING_PATHS.get(from_base)
+        if allowed is not None and to_base in allowed:
             return True, None
 
-        if from_upper == to_upper:
+        if from_base == to_base:
             # Same base type but different parameters (e.g., DECIMAL precision)
-            if from_type.upper() != to_type.upper():
-                return False, (
-                    f"Changing {from_type} to {to_type} is not supported. "
-                    "Precision/scale changes are not allowed."
-                )
-            return True, None
+            return False, (
+                f"Changing {from_type} to {to_type} is not supported. "
+                "Precision/scale changes are not allowed."
+            )
 
         return False, (
             f"Type change from {from_type} to {to_type} is not supported. "
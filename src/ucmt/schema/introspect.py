@@ -1,7 +1,11 @@
 """Schema introspection from Unity Catalog using DatabricksClient."""
 
-import json
-from typing import Protocol
+from typing import Any, Protocol
+
+try:
+    import orjson as _json
+except ImportError:
+    import json as _json
 
 from ucmt.schema.models import (
     CheckConstraint,
@@ -48,35 +52,80 @@ class SchemaIntrospector:
         if not self._is_valid_table(table_info):
             return None
 
-        columns = self._fetch_columns(table_name)
-        primary_key = self._fetch_primary_key(table_name)
-        check_constraints = self._fetch_check_constraints(table_name)
-        table_properties = self._fetch_table_properties(table_name)
-        liquid_clustering = self._parse_clustering_columns(table_info)
+        return self._build_table(
+            table_name,
+            table_info,
+            self._fetch_column_rows(table_name),
+            self._fetch_primary_key_rows(table_name),
+            self._fetch_check_constraint_rows(table_name),
+        )
+
+    def introspect_schema(self) -> Schema:
+        """Introspect all Delta tables in the schema.
+
+        Columns and constraints are fetched with one query per
+        information_schema view for the whole schema and grouped by table
+        here, so round trips do not grow with the table count. Only
+        SHOW TBLPROPERTIES, which has no bulk form, still runs per table.
+        """
+        table_infos = [
+            info for info in self._fetch_all_table_info() if self._is_valid_table(info)
+        ]
+        if not table_infos:
+            return Schema(tables={})
+
+        column_rows = self._group_by_table(self._fetch_column_rows())
+        primary_key_rows = self._group_by_table(self._fetch_primary_key_rows())
+        check_rows = self._group_by_table(self._fetch_check_constraint_rows())
+
+        tables = {}
+        for table_info in table_infos:
+            name = table_info["table_name"]
+            tables[name] = self._build_table(
+                name,
+                table_info,
+                column_rows.get(name, []),
+                primary_key_rows.get(name, []),
+                check_rows.get(name, []),
+            )
+
+        return Schema(tables=tables)
 
+    def _build_table(
+        self,
+        table_name: str,
+        table_info: dict[str, Any],
+        column_rows: list[dict[str, Any]],
+        primary_key_rows: list[dict[str, Any]],
+        check_rows: list[dict[str, Any]],
+    ) -> Table:
+        """Assemble a Table from its metadata and already-fetched rows."""
         return Table(
             name=table_name,
-            columns=columns,
-            primary_key=primary_key,
-            check_constraints=check_constraints,
-            liquid_clustering=liquid_clustering,
-            table_properties=table_properties,
+            columns=self._columns_from_rows(column_rows),
+            primary_key=self._primary_key_from_rows(primary_key_rows),
+            check_constraints=self._check_constraints_from_rows(check_rows),
+            liquid_clustering=self._parse_clustering_columns(table_info),
+            table_properties=self._fetch_table_properties(table_name),
             comment=table_info.get("comment"),
         )
 
-    def introspect_schema(self) -> Schema:
-        """Introspect all Delta tables in the schema."""
-        tables = {}
-        table_names = self._fetch_all_table_names()
-
-        for name in table_names:
-            table = self.introspect_table(name)
-            if table is not None:
-                tables[name] = table
+    def _group_by_table(
+        self, rows: list[dict[str, Any]]
+    ) -> dict[str, list[dict[str, Any]]]:
+        """Group bulk query rows by their table_name column."""
+        grouped: dict[str, list[dict[str, Any]]] = {}
+        for row in rows:
+            grouped.setdefault(self._row_get(row, "table_name"), []).append(row)
+        return grouped
 
-        return Schema(tables=tables)
+    def _table_filter(self, table_name: str | None, column: str = "table_name") -> str:
+        """SQL predicate narrowing a query to one table, or nothing for bulk."""
+        if table_name is None:
+            return ""
+        return f"AND {column} = '{table_name}'"
 
-    def _fetch_table_info(self, table_name: str) -> dict | None:
+    def _fetch_table_info(self, table_name: str) -> dict[str, Any] | None:
         """Fetch table metadata from information_schema.tables."""
         sql = f"""
             SELECT table_name, table_type, data_source_format, comment, clustering_columns
@@ -87,46 +136,44 @@ class SchemaIntrospector:
         rows = self._client.fetchall(sql)
         if not rows:
             return None
-        for row in rows:
-            if self._row_get(row, "table_name") == table_name:
-                return {
-                    "table_name": self._row_get(row, "table_name"),
-                    "table_type": self._row_get(row, "table_type"),
-                    "data_source_format": self._row_get(row, "data_source_format"),
-                    "comment": self._row_get(row, "comment"),
-                    "clustering_columns": self._row_get(row, "clustering_columns"),
-                }
-        return None
-
-    def _is_valid_table(self, table_info: dict) -> bool:
+        return self._table_info_from_row(rows[0])
+
+    def _table_info_from_row(self, row: dict[str, Any]) -> dict[str, Any]:
+        """Extract table metadata from an information_schema.tables row."""
+        return {
+            "table_name": self._row_get(row, "table_name"),
+            "table_type": self._row_get(row, "table_type"),
+            "data_source_format": self._row_get(row, "data_source_format"),
+            "comment": self._row_get(row, "comment"),
+            "clustering_columns": self._row_get(row, "clustering_columns"),
+        }
+
+    def _is_valid_table(self, table_info: dict[str, Any]) -> bool:
         """Check if table is a valid Delta table (not view, temp, streaming)."""
         table_type = (table_info.get("table_type") or "").upper()
-        data_source_format = (
-            (table_info.get("data_source_format") or "").strip().upper()
-        )
-
         if table_type not in self.VALID_TABLE_TYPES:
             return False
 
-        if data_source_format and data_source_format != "DELTA":
-            return False
-
-        return True
+        data_source_format = (
+            (table_info.get("data_source_format") or "").strip().upper()
+        )
+        return not data_source_format or data_source_format == "DELTA"
 
-    def _fetch_columns(self, table_name: str) -> list[Column]:
-        """Fetch columns from information_schema.columns."""
+    def _fetch_column_rows(self, table_name: str | None = None) -> list[dict[str, Any]]:
+        """Fetch rows from information_schema.columns for one or all tables."""
         sql = f"""
             SELECT table_name, column_name, data_type, is_nullable, column_default, comment
             FROM {self._catalog}.information_schema.columns
             WHERE table_schema = '{self._schema}'
-              AND table_name = '{table_name}'
-            ORDER BY ordinal_position
+              {self._table_filter(table_name)}
+            ORDER BY table_name, ordinal_position
         """
-        rows = self._client.fetchall(sql)
+        return self._client.fetchall(sql)
+
+    def _columns_from_rows(self, rows: list[dict[str, Any]]) -> list[Column]:
+        """Build Columns from information_schema.columns rows."""
         columns = []
         for row in rows:
-            if self._row_get(row, "table_name", table_name) != table_name:
-                continue
             col = Column(
                 name=self._row_get(row, "column_name"),
                 type=self._row_get(row, "data_type", "").upper(),
@@ -137,22 +184,29 @@ class SchemaIntrospector:
             columns.append(col)
         return columns
 
-    def _fetch_primary_key(self, table_name: str) -> PrimaryKey | None:
-        """Fetch primary key constraint."""
+    def _fetch_primary_key_rows(
+        self, table_name: str | None = None
+    ) -> list[dict[str, Any]]:
+        """Fetch primary key column rows for one or all tables."""
         sql = f"""
-            SELECT constraint_name, constraint_type, column_name, rely
+            SELECT tc.table_name, tc.constraint_name, tc.constraint_type,
+                   ccu.column_name, tc.rely
             FROM {self._catalog}.information_schema.table_constraints tc
             JOIN {self._catalog}.information_schema.constraint_column_usage ccu
               ON tc.constraint_name = ccu.constraint_name
+             AND tc.table_schema = ccu.table_schema
+             AND tc.table_name = ccu.table_name
             WHERE tc.table_schema = '{self._schema}'
-              AND tc.table_name = '{table_name}'
+              {self._table_filter(table_name, "tc.table_name")}
               AND tc.constraint_type = 'PRIMARY KEY'
         """
         try:
-            rows = self._client.fetchall(sql)
+            return self._client.fetchall(sql)
         except Exception:
-            return None
+            return []
 
+    def _primary_key_from_rows(self, rows: list[dict[str, Any]]) -> PrimaryKey | None:
+        """Build a PrimaryKey from its constraint column rows."""
         if not rows:
             return None
 
@@ -160,20 +214,26 @@ class SchemaIntrospector:
         rely = self._row_get(rows[0], "rely", False)
         return PrimaryKey(columns=columns, rely=rely)
 
-    def _fetch_check_constraints(self, table_name: str) -> list[CheckConstraint]:
-        """Fetch CHECK constraints."""
+    def _fetch_check_constraint_rows(
+        self, table_name: str | None = None
+    ) -> list[dict[str, Any]]:
+        """Fetch CHECK constraint rows for one or all tables."""
         sql = f"""
-            SELECT constraint_name, constraint_type, check_clause
+            SELECT table_name, constraint_name, constraint_type, check_clause
             FROM {self._catalog}.information_schema.table_constraints
             WHERE table_schema = '{self._schema}'
-              AND table_name = '{table_name}'
+              {self._table_filter(table_name)}
               AND constraint_type = 'CHECK'
         """
         try:
-            rows = self._client.fetchall(sql)
+            return self._client.fetchall(sql)
         except Exception:
             return []
 
+    def _check_constraints_from_rows(
+        self, rows: list[dict[str, Any]]
+    ) -> list[CheckConstraint]:
+        """Build CheckConstraints from table_constraints rows."""
         return [
             CheckConstraint(
                 name=self._row_get(row, "constraint_name"),
@@ -192,7 +252,7 @@ class SchemaIntrospector:
 
         return {self._row_get(row, "key"): self._row_get(row, "value") for row in rows}
 
-    def _parse_clustering_columns(self, table_info: dict) -> list[str]:
+    def _parse_clustering_columns(self, table_info: dict[str, Any]) -> list[str]:
         """Parse clustering columns from table info."""
         clustering = table_info.get("clustering_columns")
         if not clustering:
@@ -205,7 +265,7 @@ class SchemaIntrospector:
 
         if text.startswith("[") and text.endswith("]"):
             try:
-                parsed = json.loads(text)
+                parsed = _json.loads(text)
                 if isinstance(parsed, list):
                     return [str(c).strip() for c in parsed if str(c).strip()]
             except Exception:
@@ -213,12 +273,19 @@ class SchemaIntrospector:
 
         return [c.strip() for c in text.split(",") if c.strip()]
 
-    def _fetch_all_table_names(self) -> list[str]:
-        """Fetch all table names in the schema."""
+    def _fetch_all_table_info(self) -> list[dict[str, Any]]:
+        """Fetch metadata for candidate Delta tables in the schema.
+
+        Views, temporary/streaming tables and non-Delta formats are filtered
+        out server-side so their rows are never transferred.
+        """
+        table_types = ", ".join(f"'{t}'" for t in sorted(self.VALID_TABLE_TYPES))
         sql = f"""
-            SELECT table_name
+            SELECT table_name, table_type, data_source_format, comment, clustering_columns
             FROM {self._catalog}.information_schema.tables
             WHERE table_schema = '{self._schema}'
+              AND table_type IN ({table_types})
+              AND (data_source_format IS NULL OR upper(trim(data_source_format)) IN ('', 'DELTA'))
         """
         rows = self._client.fetchall(sql)
-        return [self._row_get(row, "table_name") for row in rows]
+        return [self._table_info_from_row(row) for row in rows]
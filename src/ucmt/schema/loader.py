@@ -5,6 +5,11 @@ from pathlib import Path
 import yaml
 from yaml import YAMLError
 
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader
+
 from ucmt.exceptions import SchemaLoadError
 from ucmt.schema.models import (
     CheckConstraint,
@@ -61,21 +66,28 @@ def _load_directory(directory: Path) -> Schema:
     return Schema(tables=tables)
 
 
-def _load_single_file(file_path: Path) -> Schema:
-    """Load schema from a single YAML file."""
+def _read_yaml_mapping(file_path: Path) -> dict:
+    """Parse a YAML file whose top level must be a mapping.
+
+    Uses libyaml's C loader when PyYAML was built with it.
+    """
     with open(file_path) as f:
         try:
-            data = yaml.safe_load(f)
+            data = yaml.load(f, Loader=_SafeLoader)
         except YAMLError as e:
             raise SchemaLoadError(f"Invalid YAML in {file_path}: {e}") from e
-
     if data is None:
         raise SchemaLoadError(f"Empty YAML file: {file_path}")
-
     if not isinstance(data, dict):
         raise SchemaLoadError(
             f"Top-level YAML must be a mapping/dict, got {type(data).__name__} in {file_path}"
         )
+    return data
+
+
+def _load_single_file(file_path: Path) -> Schema:
+    """Load schema from a single YAML file."""
+    data = _read_yaml_mapping(file_path)
 
     if "tables" in data:
         tables_field = data["tables"]
@@ -97,18 +109,7 @@ def _load_single_file(file_path: Path) -> Schema:
 
 def _parse_table_yaml(file_path: Path) -> Table:
     """Parse a table definition from a YAML file."""
-    with open(file_path) as f:
-        try:
-            data = yaml.safe_load(f)
-        except YAMLError as e:
-            raise SchemaLoadError(f"Invalid YAML in {file_path}: {e}") from e
-    if data is None:
-        raise SchemaLoadError(f"Empty YAML file: {file_path}")
-    if not isinstance(data, dict):
-        raise SchemaLoadError(
-            f"Top-level YAML must be a mapping/dict, got {type(data).__name__} in {file_path}"
-        )
-    return _parse_table_dict(data)
+    return _parse_table_dict(_read_yaml_mapping(file_path))
 
 
 def _parse_table_dict(data: dict) -> Table:
@@ -125,12 +126,11 @@ def _parse_table_dict(data: dict) -> Table:
 
     columns = [_parse_column(col) for col in data.get("columns", [])]
 
-    column_names = [c.name for c in columns]
-    seen = set()
-    for cname in column_names:
-        if cname in seen:
-            raise SchemaLoadError(f"Duplicate column name '{cname}' in table '{name}'")
-        seen.add(cname)
+    seen: set[str] = set()
+    for c in columns:
+        if c.name in seen:
+            raise SchemaLoadError(f"Duplicate column name '{c.name}' in table '{name}'")
+        seen.add(c.name)
 
     liquid_clustering = data.get("liquid_clustering", [])
     if len(liquid_clustering) > 4:
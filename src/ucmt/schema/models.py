@@ -1,10 +1,19 @@
 """Schema representation classes."""
 
+import sys
+from collections.abc import KeysView
 from dataclasses import dataclass, field
 from typing import Optional
 
 
-@dataclass
+def _intern(value: str) -> str:
+    """Intern identifier strings so dict lookups and equality hit the fast path."""
+    # sys.intern rejects str subclasses; leave those (and stray non-str YAML
+    # values) untouched.
+    return sys.intern(value) if type(value) is str else value
+
+
+@dataclass(slots=True)
 class ForeignKey:
     """
     Foreign key reference.
@@ -18,7 +27,7 @@ class ForeignKey:
     column: str
 
 
-@dataclass
+@dataclass(slots=True)
 class PrimaryKey:
     """
     Primary key definition.
@@ -35,7 +44,7 @@ class PrimaryKey:
     rely: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class CheckConstraint:
     """
     CHECK constraint - these ARE enforced by Databricks.
@@ -46,7 +55,7 @@ class CheckConstraint:
     expression: str
 
 
-@dataclass
+@dataclass(slots=True)
 class Column:
     """Column definition."""
 
@@ -58,18 +67,21 @@ class Column:
     check: Optional[str] = None
     foreign_key: Optional[ForeignKey] = None
     comment: Optional[str] = None
+    _normalized_type: str = field(init=False, repr=False, compare=False)
 
     def __post_init__(self) -> None:
-        """Strip whitespace from type. Use normalized_type for comparisons."""
+        """Strip whitespace from type and cache its normalized form."""
+        self.name = _intern(self.name)
         self.type = self.type.strip()
+        self._normalized_type = self.type.upper()
 
     @property
     def normalized_type(self) -> str:
         """Return uppercase base type for case-insensitive comparisons."""
-        return self.type.upper()
+        return self._normalized_type
 
 
-@dataclass
+@dataclass(slots=True)
 class Table:
     """Table definition."""
 
@@ -82,29 +94,31 @@ class Table:
     table_properties: dict[str, str] = field(default_factory=dict)
     comment: Optional[str] = None
 
+    def __post_init__(self) -> None:
+        """Intern the table name."""
+        self.name = _intern(self.name)
+
     def __eq__(self, other: object) -> bool:
         """Compare tables - column order, clustering order, partitioning order not significant."""
         if not isinstance(other, Table):
             return NotImplemented
         if self.name != other.name:
             return False
+        if self.comment != other.comment:
+            return False
         if self.primary_key != other.primary_key:
             return False
-        self_constraints = {c.name: c for c in self.check_constraints}
-        other_constraints = {c.name: c for c in other.check_constraints}
-        if self_constraints != other_constraints:
+        if self.table_properties != other.table_properties:
             return False
         if set(self.liquid_clustering) != set(other.liquid_clustering):
             return False
         if set(self.partitioned_by) != set(other.partitioned_by):
             return False
-        if self.table_properties != other.table_properties:
-            return False
-        if self.comment != other.comment:
+        self_constraints = {c.name: c for c in self.check_constraints}
+        other_constraints = {c.name: c for c in other.check_constraints}
+        if self_constraints != other_constraints:
             return False
-        self_cols = {col.name: col for col in self.columns}
-        other_cols = {col.name: col for col in other.columns}
-        return self_cols == other_cols
+        return self.columns_by_name == other.columns_by_name
 
     def __hash__(self) -> int:
         """Hash based on name only for dict/set usage."""
@@ -114,6 +128,11 @@ class Table:
         """Check if column mapping mode is enabled (required for DROP/RENAME)."""
         return self.table_properties.get("delta.columnMapping.mode") == "name"
 
+    @property
+    def columns_by_name(self) -> dict[str, Column]:
+        """Return a name -> column mapping built from the current columns."""
+        return {col.name: col for col in self.columns}
+
     def get_column(self, name: str) -> Optional[Column]:
         """Get a column by name."""
         for col in self.columns:
@@ -122,16 +141,29 @@ class Table:
         return None
 
 
-@dataclass
+@dataclass(slots=True)
 class Schema:
     """Complete schema definition."""
 
     tables: dict[str, Table]
 
+    def __post_init__(self) -> None:
+        """Intern table-name keys in place, keeping the caller's dict aliased."""
+        items = list(self.tables.items())
+        self.tables.clear()
+        self.tables.update((_intern(name), table) for name, table in items)
+
     def get_table(self, name: str) -> Optional[Table]:
         """Get a table by name."""
         return self.tables.get(name)
 
-    def table_names(self) -> set[str]:
-        """Get all table names."""
-        return set(self.tables.keys())
+    def get_column(self, table_name: str, column_name: str) -> Optional[Column]:
+        """Get a column by table and column name."""
+        table = self.tables.get(table_name)
+        if table is None:
+            return None
+        return table.get_column(column_name)
+
+    def table_names(self) -> KeysView[str]:
+        """Get a live, set-like view of all table names."""
+        return self.tables.keys()
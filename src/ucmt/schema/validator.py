@@ -5,20 +5,41 @@ from typing import Literal, Optional
 
 from ucmt.schema.models import Schema
 
+IssueKind = Literal[
+    "missing_table", "missing_column", "type_mismatch", "constraint_mismatch"
+]
 
-@dataclass
+_FORMATTERS: dict[IssueKind, str] = {
+    "missing_table": "Table '{0}' not found in database",
+    "missing_column": "Column '{0}' missing from table '{1}'",
+    "type_mismatch": "Column '{0}' type mismatch: expected {1}, got {2}",
+    "constraint_mismatch": "Column '{0}' nullable mismatch: expected {1}, got {2}",
+}
+
+
+@dataclass(slots=True)
 class ValidationIssue:
     """A single validation issue found during schema comparison."""
 
     table: Optional[str]
     column: Optional[str]
-    kind: Literal[
-        "missing_table", "missing_column", "type_mismatch", "constraint_mismatch"
-    ]
+    kind: IssueKind
     message: str
 
 
-@dataclass
+def _issue(
+    table: str, column: Optional[str], kind: IssueKind, *args: object
+) -> ValidationIssue:
+    """Build an issue whose message is formatted from the template for kind."""
+    return ValidationIssue(
+        table=table,
+        column=column,
+        kind=kind,
+        message=_FORMATTERS[kind].format(*args),
+    )
+
+
+@dataclass(slots=True)
 class ValidationResult:
     """Result of schema validation.
 
@@ -47,58 +68,54 @@ class SchemaValidator:
             ValidationResult with ok=True if schemas match, issues list otherwise
         """
         issues: list[ValidationIssue] = []
+        append = issues.append
 
         for table_name, yaml_table in yaml_schema.tables.items():
             db_table = db_schema.get_table(table_name)
 
             if db_table is None:
-                issues.append(
-                    ValidationIssue(
-                        table=table_name,
-                        column=None,
-                        kind="missing_table",
-                        message=f"Table '{table_name}' not found in database",
-                    )
-                )
+                append(_issue(table_name, None, "missing_table", table_name))
                 continue
 
-            yaml_cols = {col.name: col for col in yaml_table.columns}
-            db_cols = {col.name: col for col in db_table.columns}
-
-            for col_name, yaml_col in yaml_cols.items():
-                db_col = db_cols.get(col_name)
+            get_db_column = db_table.get_column
+            for yaml_col in yaml_table.columns:
+                col_name = yaml_col.name
+                db_col = get_db_column(col_name)
 
                 if db_col is None:
-                    issues.append(
-                        ValidationIssue(
-                            table=table_name,
-                            column=col_name,
-                            kind="missing_column",
-                            message=f"Column '{col_name}' missing from table '{table_name}'",
+                    append(
+                        _issue(
+                            table_name, col_name, "missing_column", col_name, table_name
                         )
                     )
                     continue
 
                 if yaml_col.normalized_type != db_col.normalized_type:
-                    issues.append(
-                        ValidationIssue(
-                            table=table_name,
-                            column=col_name,
-                            kind="type_mismatch",
-                            message=f"Column '{col_name}' type mismatch: expected {yaml_col.type}, got {db_col.type}",
+                    append(
+                        _issue(
+                            table_name,
+                            col_name,
+                            "type_mismatch",
+                            col_name,
+                            yaml_col.type,
+                            db_col.type,
                         )
                     )
                     continue
 
-                if yaml_col.nullable != db_col.nullable:
-                    expected = "nullable" if yaml_col.nullable else "NOT NULL"
-                    actual = "nullable" if db_col.nullable else "NOT NULL"
-                    issues.append(
-                        ValidationIssue(
-                            table=table_name,
-                            column=col_name,
-                            kind="constraint_mismatch",
-                            message=f"Column '{col_name}' nullable mismatch: expected {expected}, got {actual}",
+                yaml_nullable = yaml_col.nullable
+                db_nullable = db_col.nullable
+                if yaml_nullable != db_nullable:
+                    expected = "nullable" if yaml_nullable else "NOT NULL"
+                    actual = "nullable" if db_nullable else "NOT NULL"
+                    append(
+                        _issue(
+                            table_name,
+                            col_name,
+                            "constraint_mismatch",
+                            col_name,
+                            expected,
+                            actual,
                         )
                     )
 
@@ -1,36 +1,123 @@
 """Shared test helpers for UCMT tests."""
 
-from unittest.mock import MagicMock
+import argparse
+import re
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any, Self
 
 from ucmt.config import Config
+from ucmt.migrations.state import InMemoryMigrationStateStore
 from ucmt.schema.models import Schema
 
-
-class FakeRow:
+_TABLE_NAME_RE = re.compile(r"table_name\s*=\s*'([^']+)'")
+_QUERY_KIND_RE = re.compile(
+    r"information_schema\.(?P<tables>tables)\b"
+    r"|information_schema\.(?P<columns>columns)\b"
+    r"|(?P<primary_key>constraint_column_usage)"
+    r"|(?P<check>constraint_type\s*=\s*'check')"
+    r"|(?P<properties>tblproperties)",
+    re.IGNORECASE,
+)
+_BACKTICKED_RE = re.compile(r"`([^`]+)`")
+_USERS_SCHEMA_YAML = """
+table: users
+columns:
+  - name: id
+    type: BIGINT
+"""
+_TIMESTAMP_MARKER = "-- Generated:"
+
+
+class FakeRow(dict):
     """Mock row from DatabricksClient.fetchall().
 
-    Supports dict-like access via __getitem__, .get(), and .asDict().
+    A read-only dict, so __getitem__ and .get() are the C implementations.
+    Rows are shared between fetchall calls, hence mutation raises; .asDict()
+    returns a fresh plain dict, as PySpark's Row does.
     """
 
-    def __init__(self, data: dict):
-        self._data = data
+    __slots__ = ()
+
+    def _readonly(self, *args, **kwargs):
+        raise TypeError("FakeRow is read-only")
+
+    __setitem__ = __delitem__ = __ior__ = _readonly
+    clear = pop = popitem = setdefault = update = _readonly
+    asDict = dict.copy
+
+
+def _rows_by_table(data: dict[str, list[dict]] | None) -> dict[str, list[FakeRow]]:
+    """Wrap each table's row dicts in FakeRow once, up front."""
+    return {name: [FakeRow(r) for r in rows] for name, rows in (data or {}).items()}
+
+
+def _flatten_rows(rows_by_table: dict[str, list[FakeRow]]) -> list[FakeRow]:
+    """Concatenate per-table rows into one bulk result, tagging each row's table."""
+    return [
+        row if "table_name" in row else FakeRow(row, table_name=name)
+        for name, rows in rows_by_table.items()
+        for row in rows
+    ]
+
+
+class FakeClient:
+    """Plain stand-in for DatabricksClient that answers queries from a callable.
+
+    Structurally satisfies ucmt.schema.introspect.SQLClient. Every statement
+    passed to fetchall/execute is recorded in ``calls``.
+    """
+
+    __slots__ = ("_fetchall_handler", "calls")
+
+    def __init__(self, fetchall_handler: Callable[[str], list[FakeRow]]):
+        self._fetchall_handler = fetchall_handler
+        self.calls: list[str] = []
 
-    def __getitem__(self, key):
-        return self._data[key]
+    def fetchall(self, sql: str, params: dict[str, Any] | None = None) -> list[FakeRow]:
+        self.calls.append(sql)
+        return self._fetchall_handler(sql)
 
-    def get(self, key, default=None):
-        return self._data.get(key, default)
+    def execute(self, sql: str, params: dict[str, Any] | None = None) -> None:
+        self.calls.append(sql)
 
-    def asDict(self):
-        return self._data
+
+class FakeStateStore(InMemoryMigrationStateStore):
+    """In-memory migration state usable where the CLI opens a state store.
+
+    Patch ``ucmt.migrations.state.DatabricksMigrationStateStore`` with
+    ``return_value=store``; the ``with`` block then yields the store itself.
+    """
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        pass
 
 
 def make_test_config(
     catalog: str = "test_catalog",
     schema: str = "test_schema",
+    **kwargs: Any,
 ) -> Config:
     """Create a Config for tests with sensible defaults."""
-    return Config(catalog=catalog, schema=schema)
+    return Config(catalog=catalog, schema=schema, **kwargs)
+
+
+def make_db_args(**kwargs: Any) -> argparse.Namespace:
+    """Create CLI args with default DB connection options; kwargs add or override."""
+    return argparse.Namespace(
+        **{"catalog": None, "db_schema": None, "profile": "DEFAULT", **kwargs}
+    )
+
+
+def make_users_schema_dir(root: Path) -> Path:
+    """Create ``root/schema`` holding a single-column users table YAML."""
+    schema_dir = root / "schema"
+    schema_dir.mkdir()
+    (schema_dir / "users.yaml").write_text(_USERS_SCHEMA_YAML)
+    return schema_dir
 
 
 def make_mock_client(
@@ -39,8 +126,8 @@ def make_mock_client(
     pk_constraints_data: dict[str, list[dict]] | None = None,
     check_constraints_data: dict[str, list[dict]] | None = None,
     table_properties_data: dict[str, list[dict]] | None = None,
-) -> MagicMock:
-    """Create a mock DatabricksClient with test data.
+) -> FakeClient:
+    """Create a fake DatabricksClient with test data.
 
     Args:
         tables_data: List of table metadata dicts
@@ -49,49 +136,46 @@ def make_mock_client(
         check_constraints_data: Dict mapping table_name -> list of CHECK constraint dicts
         table_properties_data: Dict mapping table_name -> list of property dicts
     """
-    client = MagicMock()
-    columns_data = columns_data or {}
-    pk_constraints_data = pk_constraints_data or {}
-    check_constraints_data = check_constraints_data or {}
-    table_properties_data = table_properties_data or {}
-
-    def fetchall_side_effect(sql: str):
-        sql_lower = sql.lower()
-
-        if "information_schema.tables" in sql_lower:
-            for table in tables_data or []:
-                if f"'{table['table_name']}'" in sql_lower:
-                    return [FakeRow(table)]
-            return [FakeRow(t) for t in (tables_data or [])]
-
-        if "information_schema.columns" in sql_lower:
-            for table_name, cols in columns_data.items():
-                if f"'{table_name}'" in sql_lower:
-                    return [FakeRow(c) for c in cols]
-            return []
-
-        if "constraint_column_usage" in sql_lower:
-            for table_name, pks in pk_constraints_data.items():
-                if f"'{table_name}'" in sql_lower:
-                    return [FakeRow(pk) for pk in pks]
+    table_rows = [FakeRow(t) for t in tables_data or []]
+    tables_by_name: dict[str, list[FakeRow]] = {}
+    for row in table_rows:
+        tables_by_name.setdefault(row["table_name"], [row])
+
+    rows_by_kind = {
+        "columns": _rows_by_table(columns_data),
+        "primary_key": _rows_by_table(pk_constraints_data),
+        "check": _rows_by_table(check_constraints_data),
+    }
+    bulk_rows_by_kind = {
+        kind: _flatten_rows(rows) for kind, rows in rows_by_kind.items()
+    }
+    properties_by_table = _rows_by_table(table_properties_data)
+
+    def fetchall_side_effect(sql: str) -> list[FakeRow]:
+        match = _QUERY_KIND_RE.search(sql)
+        if match is None:
             return []
+        kind = match.lastgroup
 
-        if "table_constraints" in sql_lower and "check" in sql_lower:
-            for table_name, checks in check_constraints_data.items():
-                if f"'{table_name}'" in sql_lower:
-                    return [FakeRow(c) for c in checks]
-            return []
-
-        if "tblproperties" in sql_lower:
-            for table_name, props in table_properties_data.items():
-                if f"`{table_name}`" in sql_lower:
-                    return [FakeRow(p) for p in props]
-            return []
+        # Identifiers are matched against the raw SQL: the introspector
+        # embeds table names verbatim, so lowering would break mixed case.
+        # Each per-table query names its table once, so parse that one
+        # identifier and look it up rather than scanning for every key.
+        if kind == "properties":
+            names = _BACKTICKED_RE.findall(sql)
+            return properties_by_table.get(names[-1], []) if names else []
 
-        return []
+        # Without a table_name filter the query covers the whole schema.
+        table_match = _TABLE_NAME_RE.search(sql)
+        if kind == "tables":
+            if table_match is None:
+                return table_rows
+            return tables_by_name.get(table_match.group(1), [])
+        if table_match is None:
+            return bulk_rows_by_kind[kind]
+        return rows_by_kind[kind].get(table_match.group(1), [])
 
-    client.fetchall.side_effect = fetchall_side_effect
-    return client
+    return FakeClient(fetchall_side_effect)
 
 
 def build_db_state_from_schema(
@@ -185,5 +269,5 @@ def strip_timestamp_line(sql: str) -> list[str]:
     return [
         line.rstrip()
         for line in sql.splitlines()
-        if not line.startswith("-- Generated:")
+        if not line.startswith(_TIMESTAMP_MARKER)
     ]
@@ -5,7 +5,11 @@ These tests validate the complete UCMT workflow:
 - All tests run without real Databricks using mocked clients.
 """
 
+import re
+from dataclasses import dataclass, field
+from functools import cache
 from pathlib import Path
+from typing import Optional
 
 import pytest
 
@@ -17,6 +21,7 @@ from tests.helpers import (
 )
 from ucmt.config import Config
 from ucmt.exceptions import UnsupportedSchemaChangeError
+from ucmt.migrations.parser import MigrationFile
 from ucmt.migrations.runner import Runner
 from ucmt.migrations.state import InMemoryMigrationStateStore
 from ucmt.schema.codegen import MigrationGenerator
@@ -27,30 +32,82 @@ from ucmt.schema.models import Column, PrimaryKey, Schema, Table
 from ucmt.types import ChangeType
 
 
+# Keep this module on one xdist worker under --dist=loadgroup so the
+# module-scoped fixtures below are built once.
+pytestmark = [pytest.mark.integration, pytest.mark.xdist_group("e2e_workflow")]
+
 FIXTURES_PATH = Path(__file__).parent.parent / "fixtures" / "schema" / "tables"
 GOLDEN_SQL_PATH = Path(__file__).parent.parent / "fixtures" / "golden_sql"
 
 
+_HEADER_PREFIXES = ("-- Generated:", "-- Description:")
+
+
+def _sql_body_lines(sql: str) -> list[str]:
+    """Return SQL lines without the per-run Generated/Description headers."""
+    return [line for line in sql.splitlines() if not line.startswith(_HEADER_PREFIXES)]
+
+
+@cache
+def _load_golden(name: str) -> list[str]:
+    """Read a golden SQL file once and return its timestamp-stripped lines."""
+    return strip_timestamp_line((GOLDEN_SQL_PATH / name).read_text())
+
+
+@pytest.fixture(scope="module")
+def fixtures_schema() -> Schema:
+    """Parsed YAML schema from the fixtures directory, loaded once per module."""
+    return load_schema(FIXTURES_PATH)
+
+
+@pytest.fixture(scope="module")
+def config() -> Config:
+    """Default test config."""
+    return make_test_config()
+
+
+@pytest.fixture(scope="module")
+def empty_client():
+    """Fake client for a database with no tables.
+
+    It only answers queries, so tests can share it. Its ``calls`` log
+    accumulates across tests and should not be asserted on.
+    """
+    return make_mock_client(tables_data=[])
+
+
+@pytest.fixture(scope="module")
+def differ() -> SchemaDiffer:
+    """Shared differ; SchemaDiffer holds no per-diff state."""
+    return SchemaDiffer()
+
+
+@pytest.fixture(scope="module")
+def generator(config: Config) -> MigrationGenerator:
+    """Shared generator for the default test config."""
+    return MigrationGenerator(config.catalog, config.schema)
+
+
 class TestRoundtripYamlToDbProducesNoDiff:
     """Test that YAML -> DB -> YAML roundtrip produces no diff."""
 
-    def test_roundtrip_yaml_to_db_produces_no_diff(self):
+    def test_roundtrip_yaml_to_db_produces_no_diff(
+        self, fixtures_schema, config, differ
+    ):
         """When DB state matches YAML exactly, diff should be empty."""
-        yaml_schema = load_schema(FIXTURES_PATH)
+        yaml_schema = fixtures_schema
 
         db_state = build_db_state_from_schema(yaml_schema)
         client = make_mock_client(*db_state)
 
-        config = make_test_config()
         introspector = SchemaIntrospector(client, config.catalog, config.schema)
         db_schema = introspector.introspect_schema()
 
-        differ = SchemaDiffer()
         changes = differ.diff(db_schema, yaml_schema)
 
         assert len(changes) == 0, f"Expected no changes, got: {changes}"
 
-    def test_roundtrip_single_table_produces_no_diff(self):
+    def test_roundtrip_single_table_produces_no_diff(self, config, differ):
         """Single table roundtrip produces no diff."""
         yaml_schema = Schema(
             tables={
@@ -68,20 +125,37 @@ class TestRoundtripYamlToDbProducesNoDiff:
         db_state = build_db_state_from_schema(yaml_schema)
         client = make_mock_client(*db_state)
 
-        config = make_test_config()
         introspector = SchemaIntrospector(client, config.catalog, config.schema)
         db_schema = introspector.introspect_schema()
 
-        differ = SchemaDiffer()
         changes = differ.diff(db_schema, yaml_schema)
 
         assert len(changes) == 0
 
+    def test_roundtrip_mixed_case_table_name_produces_no_diff(self, config, differ):
+        """Mixed-case table names survive the roundtrip unchanged."""
+        yaml_schema = Schema(
+            tables={
+                "UserEvents": Table(
+                    name="UserEvents",
+                    columns=[Column(name="id", type="BIGINT", nullable=False)],
+                    table_properties={"delta.enableChangeDataFeed": "true"},
+                )
+            }
+        )
+
+        client = make_mock_client(*build_db_state_from_schema(yaml_schema))
+        introspector = SchemaIntrospector(client, config.catalog, config.schema)
+
+        assert differ.diff(introspector.introspect_schema(), yaml_schema) == []
+
 
 class TestGenerateThenApplyWorkflow:
     """Test the generate → apply workflow."""
 
-    def test_generate_then_apply_workflow(self):
+    def test_generate_then_apply_workflow(
+        self, config, empty_client, differ, generator
+    ):
         """Complete workflow: diff → generate SQL → apply migration."""
         state_store = InMemoryMigrationStateStore()
         executed_sql: list[str] = []
@@ -89,10 +163,7 @@ class TestGenerateThenApplyWorkflow:
         def mock_executor(sql: str, version: int):
             executed_sql.append(sql)
 
-        config = make_test_config()
-
-        client = make_mock_client(tables_data=[])
-        introspector = SchemaIntrospector(client, config.catalog, config.schema)
+        introspector = SchemaIntrospector(empty_client, config.catalog, config.schema)
         db_schema = introspector.introspect_schema()
 
         yaml_schema = Schema(
@@ -107,18 +178,14 @@ class TestGenerateThenApplyWorkflow:
             }
         )
 
-        differ = SchemaDiffer()
         changes = differ.diff(db_schema, yaml_schema)
         assert len(changes) == 1
         assert changes[0].change_type == ChangeType.CREATE_TABLE
 
-        generator = MigrationGenerator(config.catalog, config.schema)
         sql = generator.generate(changes, "Create users table")
 
         assert "CREATE TABLE IF NOT EXISTS ${catalog}.${schema}.users" in sql
 
-        from ucmt.migrations.parser import MigrationFile
-
         migration = MigrationFile(
             version=1,
             name="create_users",
@@ -141,18 +208,32 @@ class TestGenerateThenApplyWorkflow:
         assert state_store.has_applied(1)
 
 
-class TestFullLifecycleCreateTable:
-    """Test full lifecycle for creating a new table."""
-
-    def test_full_lifecycle_create_table(self):
-        """Full lifecycle: empty DB → create table → verify state."""
-        state_store = InMemoryMigrationStateStore()
-        executed_sql: list[str] = []
-        config = make_test_config()
-
-        db_schema = Schema(tables={})
-
-        yaml_schema = Schema(
+@dataclass(frozen=True)
+class _LifecycleCase:
+    """One diff → generate → apply scenario for TestFullLifecycle."""
+
+    id: str
+    db_schema: Schema
+    yaml_schema: Schema
+    change_type: ChangeType
+    description: str
+    details: dict = field(default_factory=dict)
+    sql_fragments: tuple[str, ...] = ()
+    executed_fragment: str = ""
+    raises: Optional[type[Exception]] = None
+    match: Optional[re.Pattern[str]] = None
+
+
+_USERS_COLUMNS = [
+    Column(name="id", type="BIGINT", nullable=False),
+    Column(name="email", type="STRING", nullable=False),
+]
+
+_LIFECYCLE_CASES = [
+    _LifecycleCase(
+        id="create_table",
+        db_schema=Schema(tables={}),
+        yaml_schema=Schema(
             tables={
                 "products": Table(
                     name="products",
@@ -167,81 +248,32 @@ class TestFullLifecycleCreateTable:
                     comment="Product catalog",
                 )
             }
-        )
-
-        differ = SchemaDiffer()
-        changes = differ.diff(db_schema, yaml_schema)
-
-        assert len(changes) == 1
-        assert changes[0].change_type == ChangeType.CREATE_TABLE
-
-        generator = MigrationGenerator(config.catalog, config.schema)
-        sql = generator.generate(changes, "Create products table")
-
-        assert "CREATE TABLE IF NOT EXISTS ${catalog}.${schema}.products" in sql
-        assert "id BIGINT NOT NULL" in sql
-        assert "name STRING NOT NULL" in sql
-        assert "price DECIMAL(10,2)" in sql
-        assert "PRIMARY KEY (id)" in sql
-        assert "CLUSTER BY (name)" in sql
-        assert "'delta.columnMapping.mode' = 'name'" in sql
-        assert "COMMENT 'Product catalog'" in sql
-
-        from ucmt.migrations.parser import MigrationFile
-
-        migration = MigrationFile(
-            version=1,
-            name="create_products",
-            path=Path("V1__create_products.sql"),
-            checksum="abc123",
-            sql=sql,
-        )
-
-        def mock_executor(sql: str, version: int):
-            executed_sql.append(sql)
-
-        runner = Runner(
-            state_store=state_store,
-            executor=mock_executor,
-            catalog=config.catalog,
-            schema=config.schema,
-        )
-        runner.apply([migration])
-
-        assert state_store.has_applied(1)
-        applied = state_store.get_last_applied()
-        assert applied is not None
-        assert applied.success is True
-
-
-class TestFullLifecycleAddColumn:
-    """Test full lifecycle for adding a column."""
-
-    def test_full_lifecycle_add_column(self):
-        """Full lifecycle: existing table → add column."""
-        state_store = InMemoryMigrationStateStore()
-        executed_sql: list[str] = []
-        config = make_test_config()
-
-        db_schema = Schema(
-            tables={
-                "users": Table(
-                    name="users",
-                    columns=[
-                        Column(name="id", type="BIGINT", nullable=False),
-                        Column(name="email", type="STRING", nullable=False),
-                    ],
-                )
-            }
-        )
-
-        yaml_schema = Schema(
+        ),
+        change_type=ChangeType.CREATE_TABLE,
+        description="Create products table",
+        sql_fragments=(
+            "CREATE TABLE IF NOT EXISTS ${catalog}.${schema}.products",
+            "id BIGINT NOT NULL",
+            "name STRING NOT NULL",
+            "price DECIMAL(10,2)",
+            "PRIMARY KEY (id)",
+            "CLUSTER BY (name)",
+            "'delta.columnMapping.mode' = 'name'",
+            "COMMENT 'Product catalog'",
+        ),
+        executed_fragment="test_catalog.test_schema.products",
+    ),
+    _LifecycleCase(
+        id="add_column",
+        db_schema=Schema(
+            tables={"users": Table(name="users", columns=list(_USERS_COLUMNS))}
+        ),
+        yaml_schema=Schema(
             tables={
                 "users": Table(
                     name="users",
                     columns=[
-                        Column(name="id", type="BIGINT", nullable=False),
-                        Column(name="email", type="STRING", nullable=False),
+                        *_USERS_COLUMNS,
                         Column(
                             name="phone",
                             type="STRING",
@@ -251,91 +283,42 @@ class TestFullLifecycleAddColumn:
                     ],
                 )
             }
-        )
-
-        differ = SchemaDiffer()
-        changes = differ.diff(db_schema, yaml_schema)
-
-        assert len(changes) == 1
-        assert changes[0].change_type == ChangeType.ADD_COLUMN
-        assert changes[0].details["column_name"] == "phone"
-
-        generator = MigrationGenerator(config.catalog, config.schema)
-        sql = generator.generate(changes, "Add phone column")
-
-        assert (
-            "ALTER TABLE ${catalog}.${schema}.users ADD COLUMN IF NOT EXISTS phone STRING"
-            in sql
-        )
-        assert "COMMENT 'User phone'" in sql
-
-        from ucmt.migrations.parser import MigrationFile
-
-        migration = MigrationFile(
-            version=1,
-            name="add_phone",
-            path=Path("V1__add_phone.sql"),
-            checksum="def456",
-            sql=sql,
-        )
-
-        def mock_executor(sql: str, version: int):
-            executed_sql.append(sql)
-
-        runner = Runner(
-            state_store=state_store,
-            executor=mock_executor,
-            catalog=config.catalog,
-            schema=config.schema,
-        )
-        runner.apply([migration])
-
-        assert state_store.has_applied(1)
-        assert "test_catalog.test_schema.users ADD COLUMN" in executed_sql[0]
-
-
-class TestFullLifecycleUnsupportedChangeBlocksApply:
-    """Test that unsupported changes block migration generation."""
-
-    def test_full_lifecycle_unsupported_change_blocks_apply(self):
-        """Unsupported changes (type narrowing) should raise during generation."""
-        config = make_test_config()
-
-        db_schema = Schema(
+        ),
+        change_type=ChangeType.ADD_COLUMN,
+        description="Add phone column",
+        details={"column_name": "phone"},
+        sql_fragments=(
+            "ALTER TABLE ${catalog}.${schema}.users ADD COLUMN IF NOT EXISTS phone STRING",
+            "COMMENT 'User phone'",
+        ),
+        executed_fragment="test_catalog.test_schema.users ADD COLUMN",
+    ),
+    _LifecycleCase(
+        id="type_narrowing_blocked",
+        db_schema=Schema(
             tables={
                 "metrics": Table(
                     name="metrics",
                     columns=[Column(name="count", type="BIGINT", nullable=True)],
                 )
             }
-        )
-
-        yaml_schema = Schema(
+        ),
+        yaml_schema=Schema(
             tables={
                 "metrics": Table(
                     name="metrics",
                     columns=[Column(name="count", type="INT", nullable=True)],
                 )
             }
-        )
-
-        differ = SchemaDiffer()
-        changes = differ.diff(db_schema, yaml_schema)
-
-        assert len(changes) == 1
-        assert changes[0].change_type == ChangeType.ALTER_COLUMN_TYPE
-        assert changes[0].is_unsupported is True
-
-        generator = MigrationGenerator(config.catalog, config.schema)
-
-        with pytest.raises(UnsupportedSchemaChangeError):
-            generator.generate(changes, "Narrow count column")
-
-    def test_partition_change_blocked(self):
-        """Partition changes are unsupported and should raise."""
-        config = make_test_config()
-
-        db_schema = Schema(
+        ),
+        change_type=ChangeType.ALTER_COLUMN_TYPE,
+        description="Narrow count column",
+        raises=UnsupportedSchemaChangeError,
+        match=re.compile(r"BIGINT to INT .*Only widening conversions"),
+    ),
+    _LifecycleCase(
+        id="partition_change_blocked",
+        db_schema=Schema(
             tables={
                 "events": Table(
                     name="events",
@@ -343,9 +326,8 @@ class TestFullLifecycleUnsupportedChangeBlocksApply:
                     partitioned_by=["region"],
                 )
             }
-        )
-
-        yaml_schema = Schema(
+        ),
+        yaml_schema=Schema(
             tables={
                 "events": Table(
                     name="events",
@@ -353,35 +335,85 @@ class TestFullLifecycleUnsupportedChangeBlocksApply:
                     partitioned_by=["country"],
                 )
             }
+        ),
+        change_type=ChangeType.ALTER_PARTITIONING,
+        description="Change partitioning",
+        raises=UnsupportedSchemaChangeError,
+        match=re.compile(r"Cannot change partitioning for table 'events'"),
+    ),
+]
+
+
+class TestFullLifecycle:
+    """Test the full diff → generate → apply lifecycle.
+
+    Unsupported changes (type narrowing, partition changes) must raise during
+    generation so they never reach apply.
+    """
+
+    @pytest.mark.parametrize("case", _LIFECYCLE_CASES, ids=lambda c: c.id)
+    def test_full_lifecycle(self, case, config, differ, generator):
+        """Each case yields exactly its expected change, then applies or is blocked."""
+        changes = differ.diff(case.db_schema, case.yaml_schema)
+
+        assert [c.change_type for c in changes] == [case.change_type]
+        for key, value in case.details.items():
+            assert changes[0].details[key] == value
+
+        if case.raises is not None:
+            assert changes[0].is_unsupported is True
+            with pytest.raises(case.raises, match=case.match):
+                generator.generate(changes, case.description)
+            return
+
+        sql = generator.generate(changes, case.description)
+        for fragment in case.sql_fragments:
+            assert fragment in sql
+
+        migration = MigrationFile(
+            version=1,
+            name=case.id,
+            path=Path(f"V1__{case.id}.sql"),
+            checksum=f"checksum_{case.id}",
+            sql=sql,
         )
 
-        differ = SchemaDiffer()
-        changes = differ.diff(db_schema, yaml_schema)
+        state_store = InMemoryMigrationStateStore()
+        executed_sql: list[str] = []
 
-        assert any(c.is_unsupported for c in changes)
+        def mock_executor(sql: str, version: int):
+            executed_sql.append(sql)
+
+        runner = Runner(
+            state_store=state_store,
+            executor=mock_executor,
+            catalog=config.catalog,
+            schema=config.schema,
+        )
+        runner.apply([migration])
 
-        generator = MigrationGenerator(config.catalog, config.schema)
-        with pytest.raises(UnsupportedSchemaChangeError):
-            generator.generate(changes, "Change partitioning")
+        assert state_store.has_applied(1)
+        applied = state_store.get_last_applied()
+        assert applied is not None
+        assert applied.success is True
+        assert case.executed_fragment in executed_sql[0]
 
 
 class TestLocalAndDatabricksProduceSameSql:
     """Test that local (offline) and Databricks (mocked online) produce same SQL."""
 
-    def test_local_and_databricks_produce_same_sql(self):
+    def test_local_and_databricks_produce_same_sql(
+        self, config, empty_client, differ, generator
+    ):
         """Offline and online modes should produce identical SQL."""
-        config = make_test_config()
-
         empty_db_schema = Schema(tables={})
         yaml_schema = load_schema(FIXTURES_PATH / "users.yaml")
 
-        differ = SchemaDiffer()
-        offline_changes = differ.diff(empty_db_schema, yaml_schema)
-
-        client = make_mock_client(tables_data=[])
-        introspector = SchemaIntrospector(client, config.catalog, config.schema)
+        introspector = SchemaIntrospector(empty_client, config.catalog, config.schema)
         online_db_schema = introspector.introspect_schema()
+        assert online_db_schema == empty_db_schema
 
+        offline_changes = differ.diff(empty_db_schema, yaml_schema)
         online_changes = differ.diff(online_db_schema, yaml_schema)
 
         assert len(offline_changes) == len(online_changes)
@@ -390,24 +422,10 @@ class TestLocalAndDatabricksProduceSameSql:
             assert off.change_type == on.change_type
             assert off.table_name == on.table_name
 
-        generator = MigrationGenerator(config.catalog, config.schema)
         offline_sql = generator.generate(offline_changes, "offline")
         online_sql = generator.generate(online_changes, "online")
 
-        offline_lines = [
-            line
-            for line in offline_sql.split("\n")
-            if not line.startswith("-- Generated:")
-            and not line.startswith("-- Description:")
-        ]
-        online_lines = [
-            line
-            for line in online_sql.split("\n")
-            if not line.startswith("-- Generated:")
-            and not line.startswith("-- Description:")
-        ]
-
-        assert offline_lines == online_lines
+        assert _sql_body_lines(offline_sql) == _sql_body_lines(online_sql)
 
 
 class TestVariableSubstitutionWorks:
@@ -428,8 +446,6 @@ CREATE TABLE IF NOT EXISTS ${catalog}.${schema}.users (
 );
 """
 
-        from ucmt.migrations.parser import MigrationFile
-
         migration = MigrationFile(
             version=1,
             name="create_users",
@@ -465,8 +481,6 @@ ALTER TABLE ${catalog}.${schema}.orders ADD COLUMN status STRING;
 ALTER TABLE ${catalog}.${schema}.users ADD COLUMN verified BOOLEAN;
 """
 
-        from ucmt.migrations.parser import MigrationFile
-
         migration = MigrationFile(
             version=1,
             name="add_columns",
@@ -493,9 +507,8 @@ ALTER TABLE ${catalog}.${schema}.users ADD COLUMN verified BOOLEAN;
 class TestGoldenSqlMatches:
     """Test that generated SQL matches golden files (except timestamp)."""
 
-    def test_create_table_golden_sql(self):
+    def test_create_table_golden_sql(self, differ, generator):
         """Generated CREATE TABLE SQL should match golden file."""
-        config = make_test_config()
 
         yaml_schema = Schema(
             tables={
@@ -510,20 +523,14 @@ class TestGoldenSqlMatches:
             }
         )
 
-        differ = SchemaDiffer()
         changes = differ.diff(Schema(tables={}), yaml_schema)
 
-        generator = MigrationGenerator(config.catalog, config.schema)
         sql = generator.generate(changes, "Create test_table")
 
-        golden_path = GOLDEN_SQL_PATH / "create_test_table.sql"
-        expected_sql = golden_path.read_text()
-
-        assert strip_timestamp_line(sql) == strip_timestamp_line(expected_sql)
+        assert strip_timestamp_line(sql) == _load_golden("create_test_table.sql")
 
-    def test_add_column_golden_sql(self):
+    def test_add_column_golden_sql(self, differ, generator):
         """Generated ADD COLUMN SQL should match golden file."""
-        config = make_test_config()
 
         db_schema = Schema(
             tables={
@@ -555,32 +562,24 @@ class TestGoldenSqlMatches:
             }
         )
 
-        differ = SchemaDiffer()
         changes = differ.diff(db_schema, yaml_schema)
 
-        generator = MigrationGenerator(config.catalog, config.schema)
         sql = generator.generate(changes, "Add phone column")
 
-        golden_path = GOLDEN_SQL_PATH / "add_phone_column.sql"
-        expected_sql = golden_path.read_text()
-
-        assert strip_timestamp_line(sql) == strip_timestamp_line(expected_sql)
+        assert strip_timestamp_line(sql) == _load_golden("add_phone_column.sql")
 
 
 class TestMultipleMigrationsInSequence:
     """Test applying multiple migrations in sequence."""
 
-    def test_multiple_migrations_in_sequence(self):
+    def test_multiple_migrations_in_sequence(self, config):
         """Multiple migrations should be applied in version order."""
         state_store = InMemoryMigrationStateStore()
         executed_sql: list[tuple[str, int]] = []
-        config = make_test_config()
 
         def mock_executor(sql: str, version: int):
             executed_sql.append((sql, version))
 
-        from ucmt.migrations.parser import MigrationFile
-
         migrations = [
             MigrationFile(
                 version=3,
@@ -625,11 +624,10 @@ class TestMultipleMigrationsInSequence:
 class TestIdempotentMigrationApplication:
     """Test that migrations are idempotent."""
 
-    def test_already_applied_migrations_skipped(self):
+    def test_already_applied_migrations_skipped(self, config):
         """Already applied migrations should not be re-executed."""
         state_store = InMemoryMigrationStateStore()
         executed_sql: list[str] = []
-        config = make_test_config()
 
         state_store.record_applied(
             version=1,
@@ -641,8 +639,6 @@ class TestIdempotentMigrationApplication:
         def mock_executor(sql: str, version: int):
             executed_sql.append(sql)
 
-        from ucmt.migrations.parser import MigrationFile
-
         migrations = [
             MigrationFile(
                 version=1,
@@ -1,24 +1,82 @@
-from unittest.mock import MagicMock, patch
+from dataclasses import dataclass, field
+from types import SimpleNamespace
+from typing import Any, Optional
 
 import pytest
+from pyspark.sql import Row
 
+from tests.helpers import FakeRow
 from ucmt.databricks.client import DatabricksClient
 
 
+@dataclass(slots=True)
+class FakeDataFrame:
+    """DataFrame returned by FakeSparkSession.sql(); only collect() is used."""
+
+    rows: list = field(default_factory=list)
+    collect_count: int = 0
+
+    def collect(self) -> list:
+        self.collect_count += 1
+        return self.rows
+
+
+@dataclass(slots=True)
+class FakeSparkSession:
+    """Records sql() calls; raises ``error`` instead when it is set."""
+
+    rows: list = field(default_factory=list)
+    error: Optional[Exception] = None
+    statements: list[tuple[str, Optional[dict[str, Any]]]] = field(default_factory=list)
+    frames: list[FakeDataFrame] = field(default_factory=list)
+    stop_count: int = 0
+
+    def sql(self, sql_statement: str, args: Optional[dict[str, Any]] = None):
+        if self.error is not None:
+            raise self.error
+        self.statements.append((sql_statement, args))
+        frame = FakeDataFrame(self.rows)
+        self.frames.append(frame)
+        return frame
+
+    def stop(self) -> None:
+        self.stop_count += 1
+
+
+@dataclass(slots=True)
+class FakeSessionBuilder:
+    """Stand-in for DatabricksSession.builder."""
+
+    session: FakeSparkSession
+    hosts: list[str] = field(default_factory=list)
+    tokens: list[str] = field(default_factory=list)
+    create_count: int = 0
+
+    def host(self, host: str) -> "FakeSessionBuilder":
+        self.hosts.append(host)
+        return self
+
+    def token(self, token: str) -> "FakeSessionBuilder":
+        self.tokens.append(token)
+        return self
+
+    def getOrCreate(self) -> FakeSparkSession:
+        self.create_count += 1
+        return self.session
+
+
 @pytest.fixture
-def mock_session():
-    with patch("ucmt.databricks.client.DatabricksSession") as mock_db_session:
-        mock_spark = MagicMock()
-        mock_builder = MagicMock()
-        mock_builder.host.return_value = mock_builder
-        mock_builder.token.return_value = mock_builder
-        mock_builder.getOrCreate.return_value = mock_spark
-        mock_db_session.builder = mock_builder
-        yield mock_db_session, mock_builder, mock_spark
+def fake_session(monkeypatch):
+    spark = FakeSparkSession()
+    builder = FakeSessionBuilder(spark)
+    monkeypatch.setattr(
+        "ucmt.databricks.client.DatabricksSession", SimpleNamespace(builder=builder)
+    )
+    return builder, spark
 
 
-def test_client_uses_host_and_token_when_provided(mock_session):
-    mock_db_session, mock_builder, _ = mock_session
+def test_client_uses_host_and_token_when_provided(fake_session):
+    builder, _ = fake_session
 
     client = DatabricksClient(
         host="test.databricks.com",
@@ -26,25 +84,25 @@ def test_client_uses_host_and_token_when_provided(mock_session):
     )
     client.connect()
 
-    mock_builder.host.assert_called_once_with("test.databricks.com")
-    mock_builder.token.assert_called_once_with("dapi123")
-    mock_builder.getOrCreate.assert_called_once()
+    assert builder.hosts == ["test.databricks.com"]
+    assert builder.tokens == ["dapi123"]
+    assert builder.create_count == 1
 
 
-def test_client_uses_env_config_when_no_host_token(mock_session):
-    mock_db_session, mock_builder, _ = mock_session
+def test_client_uses_env_config_when_no_host_token(fake_session):
+    builder, _ = fake_session
 
     client = DatabricksClient()
     client.connect()
 
-    mock_builder.host.assert_not_called()
-    mock_builder.token.assert_not_called()
-    mock_builder.getOrCreate.assert_called_once()
+    assert builder.hosts == []
+    assert builder.tokens == []
+    assert builder.create_count == 1
 
 
-def test_client_ignores_http_path(mock_session):
+def test_client_ignores_http_path(fake_session):
     """http_path is accepted but ignored (deprecated for databricks-connect)."""
-    mock_db_session, mock_builder, _ = mock_session
+    builder, _ = fake_session
 
     client = DatabricksClient(
         host="test.databricks.com",
@@ -53,15 +111,13 @@ def test_client_ignores_http_path(mock_session):
     )
     client.connect()
 
-    mock_builder.host.assert_called_once_with("test.databricks.com")
-    mock_builder.token.assert_called_once_with("dapi123")
-    mock_builder.getOrCreate.assert_called_once()
+    assert builder.hosts == ["test.databricks.com"]
+    assert builder.tokens == ["dapi123"]
+    assert builder.create_count == 1
 
 
-def test_client_executes_sql(mock_session):
-    _, _, mock_spark = mock_session
-    mock_df = MagicMock()
-    mock_spark.sql.return_value = mock_df
+def test_client_executes_sql(fake_session):
+    _, spark = fake_session
 
     client = DatabricksClient(
         host="test.databricks.com",
@@ -70,19 +126,27 @@ def test_client_executes_sql(mock_session):
     client.connect()
     client.execute("CREATE TABLE test (id INT)")
 
-    mock_spark.sql.assert_called_once_with("CREATE TABLE test (id INT)")
-    mock_df.collect.assert_called_once()
+    assert spark.statements == [("CREATE TABLE test (id INT)", None)]
+    assert spark.frames[0].collect_count == 1
+
+
+def test_client_execute_binds_params(fake_session):
+    _, spark = fake_session
 
+    client = DatabricksClient(
+        host="test.databricks.com",
+        token="dapi123",
+    )
+    client.connect()
+    client.execute("INSERT INTO t VALUES (:id)", {"id": 1})
 
-def test_client_fetchall_returns_rows(mock_session):
-    _, _, mock_spark = mock_session
-    mock_row1 = MagicMock()
-    mock_row1.asDict.return_value = {"id": 1, "name": "Alice"}
-    mock_row2 = MagicMock()
-    mock_row2.asDict.return_value = {"id": 2, "name": "Bob"}
-    mock_df = MagicMock()
-    mock_df.collect.return_value = [mock_row1, mock_row2]
-    mock_spark.sql.return_value = mock_df
+    assert spark.statements == [("INSERT INTO t VALUES (:id)", {"id": 1})]
+    assert spark.frames[0].collect_count == 1
+
+
+def test_client_fetchall_returns_rows(fake_session):
+    _, spark = fake_session
+    spark.rows = [Row(id=1, name="Alice"), Row(id=2, name="Bob")]
 
     client = DatabricksClient(
         host="test.databricks.com",
@@ -91,13 +155,31 @@ def test_client_fetchall_returns_rows(mock_session):
     client.connect()
     rows = client.fetchall("SELECT * FROM users")
 
-    mock_spark.sql.assert_called_once_with("SELECT * FROM users")
+    assert spark.statements == [("SELECT * FROM users", None)]
     assert rows == [{"id": 1, "name": "Alice"}, {"id": 2, "name": "Bob"}]
 
 
-def test_client_raises_on_sql_error(mock_session):
-    _, _, mock_spark = mock_session
-    mock_spark.sql.side_effect = Exception("Table not found")
+def test_client_fetchall_falls_back_to_asdict(fake_session):
+    """Rows without __fields__ are converted with asDict()."""
+    _, spark = fake_session
+    spark.rows = [FakeRow(id=1, name="Alice")]
+
+    client = DatabricksClient()
+    client.connect()
+
+    assert client.fetchall("SELECT * FROM users") == [{"id": 1, "name": "Alice"}]
+
+
+def test_client_fetchall_empty_result(fake_session):
+    client = DatabricksClient()
+    client.connect()
+
+    assert client.fetchall("SELECT * FROM empty") == []
+
+
+def test_client_raises_on_sql_error(fake_session):
+    _, spark = fake_session
+    spark.error = Exception("Table not found")
 
     client = DatabricksClient(
         host="test.databricks.com",
@@ -109,10 +191,8 @@ def test_client_raises_on_sql_error(mock_session):
         client.execute("SELECT * FROM nonexistent")
 
 
-def test_client_supports_non_select_commands(mock_session):
-    _, _, mock_spark = mock_session
-    mock_df = MagicMock()
-    mock_spark.sql.return_value = mock_df
+def test_client_supports_non_select_commands(fake_session):
+    _, spark = fake_session
 
     client = DatabricksClient(
         host="test.databricks.com",
@@ -123,7 +203,7 @@ def test_client_supports_non_select_commands(mock_session):
     client.execute("DROP TABLE IF EXISTS temp_table")
     client.execute("INSERT INTO users VALUES (1, 'Test')")
 
-    assert mock_spark.sql.call_count == 2
+    assert len(spark.statements) == 2
 
 
 def test_client_execute_before_connect_raises():
@@ -136,7 +216,7 @@ def test_client_execute_before_connect_raises():
         client.execute("SELECT 1")
 
 
-def test_client_connect_twice_raises(mock_session):
+def test_client_connect_twice_raises(fake_session):
     client = DatabricksClient(
         host="test.databricks.com",
         token="dapi123",
@@ -147,8 +227,8 @@ def test_client_connect_twice_raises(mock_session):
         client.connect()
 
 
-def test_client_close_is_idempotent(mock_session):
-    _, _, mock_spark = mock_session
+def test_client_close_is_idempotent(fake_session):
+    _, spark = fake_session
 
     client = DatabricksClient(
         host="test.databricks.com",
@@ -158,13 +238,11 @@ def test_client_close_is_idempotent(mock_session):
     client.close()
     client.close()
 
-    mock_spark.stop.assert_called_once()
+    assert spark.stop_count == 1
 
 
-def test_client_context_manager(mock_session):
-    _, _, mock_spark = mock_session
-    mock_df = MagicMock()
-    mock_spark.sql.return_value = mock_df
+def test_client_context_manager(fake_session):
+    _, spark = fake_session
 
     with DatabricksClient(
         host="test.databricks.com",
@@ -172,5 +250,5 @@ def test_client_context_manager(mock_session):
     ) as client:
         client.execute("SELECT 1")
 
-    mock_spark.sql.assert_called_once_with("SELECT 1")
-    mock_spark.stop.assert_called_once()
+    assert spark.statements == [("SELECT 1", None)]
+    assert spark.stop_count == 1
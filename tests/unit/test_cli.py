@@ -1,125 +1,88 @@
 """Tests for CLI commands including --online flag."""
 
-import argparse
 from unittest.mock import patch
 
-from ucmt.cli import cmd_diff, cmd_generate, cmd_pull
+import pytest
+
+from tests.helpers import (
+    FakeStateStore,
+    make_db_args,
+    make_test_config,
+    make_users_schema_dir,
+)
+from ucmt.cli import cmd_diff, cmd_generate, cmd_pull, cmd_status
 from ucmt.schema.models import Column, Schema, Table
 
+# Returned by patched helpers; the commands under test never mutate them.
+_EMPTY_SCHEMA = Schema(tables={})
+_TEST_CONFIG = make_test_config(
+    databricks_host="host",
+    databricks_token="token",
+    databricks_http_path="/sql/1.0",
+)
 
-def make_db_args(**kwargs):
-    """Create argparse.Namespace with default DB connection args."""
-    defaults = {
-        "catalog": None,
-        "db_schema": None,
-        "profile": "DEFAULT",
-    }
-    defaults.update(kwargs)
-    return argparse.Namespace(**defaults)
+_DB_ENV_VARS = (
+    "UCMT_CATALOG",
+    "UCMT_SCHEMA",
+    "DATABRICKS_HOST",
+    "DATABRICKS_TOKEN",
+    "DATABRICKS_HTTP_PATH",
+    "DATABRICKS_CONFIG_PROFILE",
+)
 
 
-class TestCmdDiffOffline:
-    """Test cmd_diff in offline mode (default)."""
+@pytest.fixture
+def no_db_env(monkeypatch, tmp_path):
+    """Unset the DB settings Config.from_env reads and hide ~/.databrickscfg."""
+    for name in _DB_ENV_VARS:
+        monkeypatch.delenv(name, raising=False)
+    monkeypatch.setenv("HOME", str(tmp_path))
 
-    def test_diff_offline_compares_against_empty_schema(self, tmp_path):
-        """Offline mode should compare declared schema against empty schema."""
-        schema_dir = tmp_path / "schema"
-        schema_dir.mkdir()
-        (schema_dir / "users.yaml").write_text(
-            """
-table: users
-columns:
-  - name: id
-    type: BIGINT
-"""
-        )
 
-        args = make_db_args(schema_path=schema_dir, online=False)
+_MODES = pytest.mark.parametrize("online", [False, True], ids=["offline", "online"])
 
-        with patch("builtins.print") as mock_print:
-            result = cmd_diff(args)
 
-        assert result == 0
-        mock_print.assert_any_call("Found 1 changes (offline mode):")
+class TestCmdDiff:
+    """Test cmd_diff in offline (default) and online mode."""
 
-    def test_diff_offline_no_changes_when_empty_schema(self, tmp_path):
-        """Offline mode with empty schema dir should show no changes."""
-        schema_dir = tmp_path / "schema"
-        schema_dir.mkdir()
+    @_MODES
+    def test_diff_reports_changes_against_current_schema(
+        self, tmp_path, capsys, online
+    ):
+        """Offline diffs against an empty schema; online uses get_online_schema."""
+        schema_dir = make_users_schema_dir(tmp_path)
 
-        args = make_db_args(schema_path=schema_dir, online=False)
+        args = make_db_args(schema_path=schema_dir, online=online)
 
-        with patch("builtins.print") as mock_print:
+        with (
+            patch("ucmt.cli.get_online_schema", return_value=_EMPTY_SCHEMA) as mock_get,
+            patch("ucmt.cli.build_config_and_validate", return_value=_TEST_CONFIG),
+        ):
             result = cmd_diff(args)
 
+        if online:
+            mock_get.assert_called_once()
+        else:
+            mock_get.assert_not_called()
         assert result == 0
-        mock_print.assert_called_with("No changes detected")
-
-
-class TestCmdDiffOnline:
-    """Test cmd_diff in online mode."""
-
-    def test_diff_online_requires_db_config(self, tmp_path):
-        """Online mode should fail if DB config is missing."""
-        schema_dir = tmp_path / "schema"
-        schema_dir.mkdir()
-        (schema_dir / "users.yaml").write_text(
-            """
-table: users
-columns:
-  - name: id
-    type: BIGINT
-"""
-        )
-
-        args = make_db_args(schema_path=schema_dir, online=True)
-
-        with patch.dict("os.environ", {}, clear=True):
-            with patch("builtins.print"):
-                result = cmd_diff(args)
+        mode = "online" if online else "offline"
+        assert f"Found 1 changes ({mode} mode):" in capsys.readouterr().out
 
-        assert result == 2  # ConfigError returns exit code 2
-
-    def test_diff_online_uses_get_online_schema(self, tmp_path):
-        """Online mode should use get_online_schema helper."""
+    def test_diff_offline_no_changes_when_empty_schema(self, tmp_path, capsys):
+        """Offline mode with empty schema dir should show no changes."""
         schema_dir = tmp_path / "schema"
         schema_dir.mkdir()
-        (schema_dir / "users.yaml").write_text(
-            """
-table: users
-columns:
-  - name: id
-    type: BIGINT
-"""
-        )
 
-        args = make_db_args(schema_path=schema_dir, online=True)
-
-        mock_schema = Schema(tables={})
+        args = make_db_args(schema_path=schema_dir, online=False)
 
-        with (
-            patch("ucmt.cli.get_online_schema", return_value=mock_schema) as mock_get,
-            patch("ucmt.cli.build_config_and_validate"),
-            patch("builtins.print") as mock_print,
-        ):
-            result = cmd_diff(args)
+        result = cmd_diff(args)
 
-        mock_get.assert_called_once()
         assert result == 0
-        mock_print.assert_any_call("Found 1 changes (online mode):")
+        assert capsys.readouterr().out.splitlines()[-1] == "No changes detected"
 
     def test_diff_online_returns_1_when_introspection_fails(self, tmp_path):
         """Online mode should return 1 if get_online_schema raises an exception."""
-        schema_dir = tmp_path / "schema"
-        schema_dir.mkdir()
-        (schema_dir / "users.yaml").write_text(
-            """
-table: users
-columns:
-  - name: id
-    type: BIGINT
-"""
-        )
+        schema_dir = make_users_schema_dir(tmp_path)
 
         args = make_db_args(schema_path=schema_dir, online=True)
 
@@ -128,122 +91,70 @@ columns:
                 "ucmt.cli.get_online_schema",
                 side_effect=Exception("Connection failed"),
             ),
-            patch("ucmt.cli.build_config_and_validate"),
-            patch("builtins.print"),
+            patch("ucmt.cli.build_config_and_validate", return_value=_TEST_CONFIG),
         ):
             result = cmd_diff(args)
 
         assert result == 1
 
 
-class TestCmdGenerateOffline:
-    """Test cmd_generate in offline mode."""
+class TestCmdGenerate:
+    """Test cmd_generate in offline (default) and online mode."""
 
-    def test_generate_offline_compares_against_empty_schema(self, tmp_path):
-        """Offline mode should generate migration comparing against empty schema."""
-        schema_dir = tmp_path / "schema"
-        schema_dir.mkdir()
-        (schema_dir / "users.yaml").write_text(
-            """
-table: users
-columns:
-  - name: id
-    type: BIGINT
-"""
-        )
+    @_MODES
+    def test_generate_emits_create_table(self, tmp_path, capsys, online):
+        """Offline compares against an empty schema; online uses get_online_schema."""
+        schema_dir = make_users_schema_dir(tmp_path)
 
         args = make_db_args(
             schema_path=schema_dir,
-            online=False,
+            online=online,
             description="Add users table",
             allow_destructive=False,
             output=None,
         )
 
-        with patch("builtins.print") as mock_print:
+        with (
+            patch("ucmt.cli.get_online_schema", return_value=_EMPTY_SCHEMA) as mock_get,
+            patch("ucmt.cli.Config.validate_for_db_ops"),
+        ):
             result = cmd_generate(args)
 
+        if online:
+            mock_get.assert_called_once()
+        else:
+            mock_get.assert_not_called()
         assert result == 0
-        printed_output = " ".join(str(call) for call in mock_print.call_args_list)
-        assert "CREATE TABLE" in printed_output
-
-
-class TestCmdGenerateOnline:
-    """Test cmd_generate in online mode."""
-
-    def test_generate_online_requires_db_config(self, tmp_path):
-        """Online mode should fail if DB config is missing."""
-        schema_dir = tmp_path / "schema"
-        schema_dir.mkdir()
-        (schema_dir / "users.yaml").write_text(
-            """
-table: users
-columns:
-  - name: id
-    type: BIGINT
-"""
-        )
-
-        args = make_db_args(
-            schema_path=schema_dir,
-            online=True,
-            description="Add users table",
-            allow_destructive=False,
-        )
+        assert "CREATE TABLE" in capsys.readouterr().out
 
-        with patch.dict("os.environ", {}, clear=True):
-            with patch("builtins.print"):
-                result = cmd_generate(args)
 
-        assert result == 2  # ConfigError returns exit code 2
+class TestOnlineRequiresDbConfig:
+    """Test online diff/generate fail fast without DB config."""
 
-    def test_generate_online_uses_get_online_schema(self, tmp_path):
-        """Online mode should use get_online_schema helper."""
-        schema_dir = tmp_path / "schema"
-        schema_dir.mkdir()
-        (schema_dir / "users.yaml").write_text(
-            """
-table: users
-columns:
-  - name: id
-    type: BIGINT
-"""
-        )
+    @pytest.mark.parametrize(
+        "command", [cmd_diff, cmd_generate], ids=["diff", "generate"]
+    )
+    def test_online_requires_db_config(self, tmp_path, no_db_env, command):
+        """Online mode should exit 2 (ConfigError) if DB config is missing."""
+        schema_dir = make_users_schema_dir(tmp_path)
 
         args = make_db_args(
             schema_path=schema_dir,
             online=True,
             description="Add users table",
             allow_destructive=False,
-            output=None,
         )
 
-        mock_schema = Schema(tables={})
-
-        with (
-            patch("ucmt.cli.get_online_schema", return_value=mock_schema) as mock_get,
-            patch("ucmt.cli.Config.from_env"),
-            patch("builtins.print") as mock_print,
-        ):
-            result = cmd_generate(args)
+        result = command(args)
 
-        mock_get.assert_called_once()
-        assert result == 0
-        printed_output = " ".join(str(call) for call in mock_print.call_args_list)
-        assert "CREATE TABLE" in printed_output
+        assert result == 2
 
 
 class TestCmdStatus:
     """Test cmd_status displays failed migrations correctly."""
 
-    def test_status_shows_failed_migrations(self, tmp_path):
+    def test_status_shows_failed_migrations(self, tmp_path, capsys):
         """Status should show ✗ failed for migrations with success=False."""
-        from datetime import datetime
-        from unittest.mock import MagicMock
-
-        from ucmt.cli import cmd_status
-        from ucmt.migrations.state import AppliedMigration
-
         migrations_dir = tmp_path / "sql" / "migrations"
         migrations_dir.mkdir(parents=True)
         (migrations_dir / "V001__create_users.sql").write_text(
@@ -255,54 +166,34 @@ class TestCmdStatus:
 
         args = make_db_args(migrations_path=migrations_dir)
 
-        mock_state_store = MagicMock()
-        mock_state_store.__enter__ = MagicMock(return_value=mock_state_store)
-        mock_state_store.__exit__ = MagicMock(return_value=False)
-        mock_state_store.list_applied.return_value = [
-            AppliedMigration(
-                version=1,
-                name="create_users",
-                checksum="abc",
-                applied_at=datetime.now(),
-                success=True,
-            ),
-            AppliedMigration(
-                version=2,
-                name="add_email",
-                checksum="def",
-                applied_at=datetime.now(),
-                success=False,
-                error="syntax error",
-            ),
-        ]
+        state_store = FakeStateStore()
+        state_store.record_applied(1, "create_users", "abc", success=True)
+        state_store.record_applied(
+            2, "add_email", "def", success=False, error="syntax error"
+        )
 
         with (
             patch(
                 "ucmt.migrations.state.DatabricksMigrationStateStore",
-                return_value=mock_state_store,
+                return_value=state_store,
             ),
-            patch("ucmt.cli.build_config_and_validate"),
-            patch("builtins.print") as mock_print,
+            patch("ucmt.cli.build_config_and_validate", return_value=_TEST_CONFIG),
         ):
             result = cmd_status(args)
 
         assert result == 0
-        printed_calls = [str(call) for call in mock_print.call_args_list]
-        printed_output = " ".join(printed_calls)
-        assert "V2" in printed_output and "✗ failed" in printed_output
+        assert "  V2: add_email [✗ failed]" in capsys.readouterr().out.splitlines()
 
 
 class TestCmdPull:
     """Test cmd_pull command."""
 
-    def test_pull_requires_db_config(self, tmp_path):
+    def test_pull_requires_db_config(self, tmp_path, no_db_env):
         """Pull should fail with exit code 2 if DB config is missing."""
         output_dir = tmp_path / "schema"
         args = make_db_args(output=output_dir, stamp=False)
 
-        with patch.dict("os.environ", {}, clear=True):
-            with patch("builtins.print"):
-                result = cmd_pull(args)
+        result = cmd_pull(args)
 
         assert result == 2
 
@@ -321,9 +212,8 @@ class TestCmdPull:
         )
 
         with (
-            patch("ucmt.cli.build_config_and_validate"),
+            patch("ucmt.cli.build_config_and_validate", return_value=_TEST_CONFIG),
             patch("ucmt.cli.get_online_schema", return_value=mock_schema),
-            patch("builtins.print"),
         ):
             result = cmd_pull(args)
 
@@ -335,12 +225,9 @@ class TestCmdPull:
         output_dir = tmp_path / "schema"
         args = make_db_args(output=output_dir, stamp=False)
 
-        empty_schema = Schema(tables={})
-
         with (
-            patch("ucmt.cli.build_config_and_validate"),
-            patch("ucmt.cli.get_online_schema", return_value=empty_schema),
-            patch("builtins.print"),
+            patch("ucmt.cli.build_config_and_validate", return_value=_TEST_CONFIG),
+            patch("ucmt.cli.get_online_schema", return_value=_EMPTY_SCHEMA),
         ):
             result = cmd_pull(args)
 
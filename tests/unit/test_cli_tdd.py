@@ -1,24 +1,50 @@
 """TDD tests for CLI module - tests written FIRST per ucmt-fy5."""
 
 import argparse
-from datetime import datetime
 from unittest.mock import MagicMock, patch
 
 import pytest
 
+from tests.helpers import (
+    FakeStateStore,
+    make_db_args,
+    make_test_config,
+    make_users_schema_dir,
+)
+from ucmt.cli import (
+    cmd_diff,
+    cmd_generate,
+    cmd_plan,
+    cmd_run,
+    cmd_status,
+    cmd_validate,
+    main,
+)
+from ucmt.config import Config
+from ucmt.databricks.client import DatabricksClient
 from ucmt.exceptions import ConfigError
-from ucmt.migrations.state import AppliedMigration
-
-
-def make_db_args(**kwargs):
-    """Create argparse.Namespace with default DB connection args."""
-    defaults = {
-        "catalog": None,
-        "db_schema": None,
-        "profile": "DEFAULT",
-    }
-    defaults.update(kwargs)
-    return argparse.Namespace(**defaults)
+from ucmt.schema.diff import SchemaChange
+from ucmt.schema.models import Schema
+from ucmt.types import ChangeType
+
+# Shared across tests; the commands under test only read them.
+_TEST_CONFIG = make_test_config(
+    databricks_host="host",
+    databricks_token="token",
+    databricks_http_path="/sql/1.0",
+)
+_EMPTY_SCHEMA = Schema(tables={})
+_DROP_TABLE_CHANGE = SchemaChange(
+    change_type=ChangeType.DROP_TABLE,
+    table_name="users",
+    is_destructive=True,
+)
+_DROP_COLUMN_CHANGE = SchemaChange(
+    change_type=ChangeType.DROP_COLUMN,
+    table_name="users",
+    details={"column_name": "email"},
+    is_destructive=True,
+)
 
 
 class TestCliHelp:
@@ -26,8 +52,6 @@ class TestCliHelp:
 
     def test_cli_help_shows_all_commands(self, capsys):
         """Help output should list all available commands."""
-        from ucmt.cli import main
-
         with pytest.raises(SystemExit) as exc_info:
             with patch("sys.argv", ["ucmt", "--help"]):
                 main()
@@ -52,11 +76,7 @@ class TestCliApply:
         migrations_dir.mkdir()
         (migrations_dir / "V001__init.sql").write_text("CREATE TABLE test (id INT);")
 
-        from ucmt.cli import cmd_run
-
-        mock_state_store = MagicMock()
-        mock_state_store.has_applied.return_value = False
-        mock_state_store.list_applied.return_value = []
+        state_store = FakeStateStore()
 
         args = make_db_args(
             migrations_path=migrations_dir,
@@ -64,32 +84,24 @@ class TestCliApply:
             allow_destructive=False,
         )
 
-        mock_config = MagicMock()
-        mock_config.catalog = "test_catalog"
-        mock_config.schema = "test_schema"
-        mock_config.databricks_host = "host"
-        mock_config.databricks_token = "token"
-        mock_config.databricks_http_path = "/sql/1.0"
-
         with (
-            patch("ucmt.cli.build_config_and_validate", return_value=mock_config),
+            patch("ucmt.cli.build_config_and_validate", return_value=_TEST_CONFIG),
             patch(
                 "ucmt.migrations.state.DatabricksMigrationStateStore",
-            ) as mock_store_cls,
-            patch("ucmt.databricks.client.DatabricksClient") as mock_client_cls,
+                return_value=state_store,
+            ),
+            patch(
+                "ucmt.databricks.client.DatabricksClient", autospec=True
+            ) as mock_client_cls,
         ):
-            mock_store_cls.return_value.__enter__ = MagicMock(
-                return_value=mock_state_store
-            )
-            mock_store_cls.return_value.__exit__ = MagicMock(return_value=False)
-
-            mock_client = MagicMock()
+            mock_client = MagicMock(spec=DatabricksClient)
             mock_client_cls.return_value.__enter__.return_value = mock_client
 
             result = cmd_run(args)
 
         assert result == 0
         mock_client.execute.assert_called()
+        assert state_store.has_applied(1)
 
 
 class TestCliGenerate:
@@ -97,18 +109,7 @@ class TestCliGenerate:
 
     def test_cli_generate_creates_migration_file(self, tmp_path, capsys):
         """Generate command should output migration SQL."""
-        schema_dir = tmp_path / "schema"
-        schema_dir.mkdir()
-        (schema_dir / "users.yaml").write_text(
-            """
-table: users
-columns:
-  - name: id
-    type: BIGINT
-"""
-        )
-
-        from ucmt.cli import cmd_generate
+        schema_dir = make_users_schema_dir(tmp_path)
 
         args = make_db_args(
             schema_path=schema_dir,
@@ -134,8 +135,6 @@ class TestCliValidate:
         schema_dir.mkdir()
         (schema_dir / "invalid.yaml").write_text("not: valid: yaml: {{")
 
-        from ucmt.cli import cmd_validate
-
         args = argparse.Namespace(schema_path=schema_dir)
         result = cmd_validate(args)
 
@@ -147,18 +146,7 @@ class TestCliDiff:
 
     def test_cli_diff_prints_changes_no_execution(self, tmp_path, capsys):
         """Diff should print changes without executing anything."""
-        schema_dir = tmp_path / "schema"
-        schema_dir.mkdir()
-        (schema_dir / "users.yaml").write_text(
-            """
-table: users
-columns:
-  - name: id
-    type: BIGINT
-"""
-        )
-
-        from ucmt.cli import cmd_diff
+        schema_dir = make_users_schema_dir(tmp_path)
 
         args = make_db_args(schema_path=schema_dir, online=False)
         result = cmd_diff(args)
@@ -180,24 +168,17 @@ class TestCliPlan:
         (migrations_dir / "V001__init.sql").write_text("CREATE TABLE t (id INT);")
         (migrations_dir / "V002__add_col.sql").write_text("ALTER TABLE t ADD col INT;")
 
-        from ucmt.cli import cmd_plan
-
-        mock_state_store = MagicMock()
-        mock_state_store.list_applied.return_value = []
-        mock_state_store.has_applied.return_value = False
+        state_store = FakeStateStore()
 
         args = make_db_args(migrations_path=migrations_dir)
 
         with (
-            patch("ucmt.cli.build_config_and_validate"),
+            patch("ucmt.cli.build_config_and_validate", return_value=_TEST_CONFIG),
             patch(
                 "ucmt.migrations.state.DatabricksMigrationStateStore",
-            ) as mock_store_cls,
+                return_value=state_store,
+            ),
         ):
-            mock_store_cls.return_value.__enter__ = MagicMock(
-                return_value=mock_state_store
-            )
-            mock_store_cls.return_value.__exit__ = MagicMock(return_value=False)
             result = cmd_plan(args)
 
         assert result == 0
@@ -216,31 +197,18 @@ class TestCliStatus:
         (migrations_dir / "V001__init.sql").write_text("CREATE TABLE t (id INT);")
         (migrations_dir / "V002__add_col.sql").write_text("ALTER TABLE t ADD col INT;")
 
-        from ucmt.cli import cmd_status
-
-        mock_state_store = MagicMock()
-        mock_state_store.list_applied.return_value = [
-            AppliedMigration(
-                version=1,
-                name="init",
-                checksum="abc",
-                applied_at=datetime.now(),
-                success=True,
-            )
-        ]
+        state_store = FakeStateStore()
+        state_store.record_applied(1, "init", "abc", success=True)
 
         args = make_db_args(migrations_path=migrations_dir)
 
         with (
-            patch("ucmt.cli.build_config_and_validate"),
+            patch("ucmt.cli.build_config_and_validate", return_value=_TEST_CONFIG),
             patch(
                 "ucmt.migrations.state.DatabricksMigrationStateStore",
-            ) as mock_store_cls,
+                return_value=state_store,
+            ),
         ):
-            mock_store_cls.return_value.__enter__ = MagicMock(
-                return_value=mock_state_store
-            )
-            mock_store_cls.return_value.__exit__ = MagicMock(return_value=False)
             result = cmd_status(args)
 
         assert result == 0
@@ -254,18 +222,7 @@ class TestCliExitCodes:
 
     def test_cli_exits_0_on_success(self, tmp_path):
         """CLI should exit 0 on successful operations."""
-        schema_dir = tmp_path / "schema"
-        schema_dir.mkdir()
-        (schema_dir / "users.yaml").write_text(
-            """
-table: users
-columns:
-  - name: id
-    type: BIGINT
-"""
-        )
-
-        from ucmt.cli import cmd_validate
+        schema_dir = make_users_schema_dir(tmp_path)
 
         args = argparse.Namespace(schema_path=schema_dir)
         result = cmd_validate(args)
@@ -276,8 +233,6 @@ columns:
         """CLI should exit 1 on runtime errors."""
         schema_dir = tmp_path / "nonexistent"
 
-        from ucmt.cli import cmd_validate
-
         args = argparse.Namespace(schema_path=schema_dir)
         result = cmd_validate(args)
 
@@ -289,8 +244,6 @@ columns:
         migrations_dir.mkdir()
         (migrations_dir / "V001__init.sql").write_text("CREATE TABLE t (id INT);")
 
-        from ucmt.cli import cmd_run
-
         args = make_db_args(
             migrations_path=migrations_dir,
             dry_run=False,
@@ -309,8 +262,6 @@ columns:
         schema_dir.mkdir()
         (schema_dir / "bad.yaml").write_text("invalid: yaml: {{{")
 
-        from ucmt.cli import cmd_validate
-
         args = argparse.Namespace(schema_path=schema_dir)
         result = cmd_validate(args)
 
@@ -322,8 +273,6 @@ class TestCliConfigPrecedence:
 
     def test_cli_respects_config_precedence(self):
         """CLI args should override environment variables."""
-        from ucmt.config import Config
-
         with patch.dict(
             "os.environ",
             {"UCMT_CATALOG": "env_catalog", "UCMT_SCHEMA": "env_schema"},
@@ -337,124 +286,42 @@ class TestCliConfigPrecedence:
 class TestCliDestructiveOperations:
     """Test destructive operation protection."""
 
-    def test_cli_requires_allow_destructive_for_drops(self, tmp_path, capsys):
-        """CLI should require --allow-destructive for DROP operations."""
-        schema_dir = tmp_path / "schema"
-        schema_dir.mkdir()
-
-        from ucmt.cli import cmd_generate
-        from ucmt.schema.diff import SchemaChange
-        from ucmt.schema.models import Schema
-        from ucmt.types import ChangeType
-
-        args = make_db_args(
-            schema_path=schema_dir,
-            online=False,
-            description="drop_users_table",
-            output=None,
-            allow_destructive=False,
-        )
-
-        drop_change = SchemaChange(
-            change_type=ChangeType.DROP_TABLE,
-            table_name="users",
-            is_destructive=True,
-        )
-
-        with (
-            patch("ucmt.cli.load_schema", return_value=Schema(tables={})),
-            patch("ucmt.cli.SchemaDiffer") as mock_differ_cls,
-        ):
-            mock_differ = MagicMock()
-            mock_differ.diff.return_value = [drop_change]
-            mock_differ_cls.return_value = mock_differ
-
-            result = cmd_generate(args)
-
-        assert result == 1
-        captured = capsys.readouterr()
-        assert (
-            "destructive" in captured.err.lower()
-            or "allow-destructive" in captured.err.lower()
-        )
-
-    def test_cli_allows_destructive_with_flag(self, tmp_path, capsys):
-        """CLI should allow DROP operations with --allow-destructive flag."""
-        schema_dir = tmp_path / "schema"
-        schema_dir.mkdir()
-
-        from ucmt.cli import cmd_generate
-        from ucmt.schema.diff import SchemaChange
-        from ucmt.schema.models import Schema
-        from ucmt.types import ChangeType
-
+    @pytest.mark.parametrize(
+        ("change", "allow_destructive", "expected_exit"),
+        [
+            pytest.param(_DROP_TABLE_CHANGE, False, 1, id="drop_table_blocked"),
+            pytest.param(_DROP_COLUMN_CHANGE, False, 1, id="drop_column_blocked"),
+            pytest.param(_DROP_TABLE_CHANGE, True, 0, id="drop_table_allowed"),
+        ],
+    )
+    def test_cli_destructive_changes_require_flag(
+        self, tmp_path, capsys, change, allow_destructive, expected_exit
+    ):
+        """Destructive changes fail without --allow-destructive and generate with it."""
         args = make_db_args(
-            schema_path=schema_dir,
+            schema_path=tmp_path,
             online=False,
-            description="drop_users_table",
+            description="drop_users",
             output=None,
-            allow_destructive=True,
-        )
-
-        drop_change = SchemaChange(
-            change_type=ChangeType.DROP_TABLE,
-            table_name="users",
-            is_destructive=True,
+            allow_destructive=allow_destructive,
         )
 
         with (
-            patch("ucmt.cli.load_schema", return_value=Schema(tables={})),
+            patch("ucmt.cli.load_schema", return_value=_EMPTY_SCHEMA),
             patch("ucmt.cli.SchemaDiffer") as mock_differ_cls,
             patch("ucmt.cli.MigrationGenerator") as mock_gen_cls,
-            patch("ucmt.cli.Config.from_env"),
-        ):
-            mock_differ = MagicMock()
-            mock_differ.diff.return_value = [drop_change]
-            mock_differ_cls.return_value = mock_differ
-
-            mock_gen = MagicMock()
-            mock_gen.generate.return_value = "DROP TABLE users;"
-            mock_gen_cls.return_value = mock_gen
-
-            result = cmd_generate(args)
-
-        assert result == 0
-
-    def test_cli_detects_drop_column_as_destructive(self, tmp_path, capsys):
-        """CLI should detect DROP COLUMN in SQL as destructive."""
-        schema_dir = tmp_path / "schema"
-        schema_dir.mkdir()
-
-        from ucmt.cli import cmd_generate
-        from ucmt.schema.diff import SchemaChange
-        from ucmt.schema.models import Schema
-        from ucmt.types import ChangeType
-
-        args = make_db_args(
-            schema_path=schema_dir,
-            online=False,
-            description="drop_column",
-            output=None,
-            allow_destructive=False,
-        )
-
-        drop_col_change = SchemaChange(
-            change_type=ChangeType.DROP_COLUMN,
-            table_name="users",
-            details={"column_name": "email"},
-            is_destructive=True,
-        )
-
-        with (
-            patch("ucmt.cli.load_schema", return_value=Schema(tables={})),
-            patch("ucmt.cli.SchemaDiffer") as mock_differ_cls,
         ):
-            mock_differ = MagicMock()
-            mock_differ.diff.return_value = [drop_col_change]
-            mock_differ_cls.return_value = mock_differ
+            mock_differ_cls.return_value.diff.return_value = [change]
+            mock_gen_cls.return_value.generate.return_value = "DROP TABLE users;"
 
             result = cmd_generate(args)
 
-        assert result == 1
+        assert result == expected_exit
+        generate = mock_gen_cls.return_value.generate
         captured = capsys.readouterr()
-        assert "destructive" in captured.err.lower()
+        if allow_destructive:
+            generate.assert_called_once()
+            assert "destructive" not in captured.err.lower()
+        else:
+            generate.assert_not_called()
+            assert "destructive" in captured.err.lower()
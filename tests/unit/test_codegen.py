@@ -17,15 +17,15 @@ from ucmt.schema.models import (
 from ucmt.types import ChangeType
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def generator() -> MigrationGenerator:
-    """Create a generator with test catalog/schema."""
+    """Generator with test catalog/schema, shared by the module (it is stateless)."""
     return MigrationGenerator(catalog="test_catalog", schema="test_schema")
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def users_table() -> Table:
-    """Create a sample users table."""
+    """Sample users table, built once per module; tests must not mutate it."""
     return Table(
         name="users",
         columns=[
@@ -341,6 +341,39 @@ class TestCodegenEmptyChanges:
         assert "DROP" not in result
 
 
+class TestCodegenSubclassing:
+    """Tests that dispatch respects subclass overrides."""
+
+    def test_codegen_subclass_override_is_used(self):
+        """Overriding a _gen_* method changes the SQL emitted for that change type."""
+
+        class CustomGenerator(MigrationGenerator):
+            def _gen_drop_table(self, change: SchemaChange) -> str:
+                return f"-- custom drop {change.table_name}"
+
+        change = SchemaChange(
+            change_type=ChangeType.DROP_TABLE, table_name="users", is_destructive=True
+        )
+        result = CustomGenerator(catalog="c", schema="s").generate([change], "drop")
+
+        assert "-- custom drop users" in result
+
+    def test_codegen_generators_cover_every_change_type(self):
+        """Every ChangeType maps to an existing method, except the known gaps."""
+        # Partitioning changes are always rejected as unsupported, and the
+        # differ never emits foreign-key changes.
+        no_generator = {
+            ChangeType.ADD_FOREIGN_KEY,
+            ChangeType.DROP_FOREIGN_KEY,
+            ChangeType.ALTER_PARTITIONING,
+        }
+        generators = MigrationGenerator._GENERATORS
+
+        assert generators.keys() == set(ChangeType) - no_generator
+        for name in generators.values():
+            assert callable(getattr(MigrationGenerator, name, None)), name
+
+
 class TestCodegenEscaping:
     """Tests for SQL string escaping."""
 
@@ -199,6 +199,16 @@ class TestReadsAppliedMigrations:
         store = DatabricksMigrationStateStore(config)
         assert store.has_applied(999) is False
 
+    def test_has_applied_limits_rows_server_side(self, config: Config, mock_client):
+        _, mock_instance = mock_client
+        mock_instance.fetchall.return_value = [{"version": 1}]
+
+        store = DatabricksMigrationStateStore(config)
+        store.has_applied(1)
+
+        sql = mock_instance.fetchall.call_args[0][0]
+        assert "WHERE version = 1 LIMIT 1" in sql
+
 
 class TestRecordsSuccess:
     def test_records_success(self, config: Config, mock_client):
@@ -260,6 +270,32 @@ class TestRecordsFailure:
         ]
         assert len(insert_calls) >= 1
 
+    def test_records_values_as_bound_parameters(self, config: Config, mock_client):
+        _, mock_instance = mock_client
+        mock_instance.fetchall.return_value = []
+
+        store = DatabricksMigrationStateStore(config)
+        store.record_applied(
+            version=7,
+            name="it's_quoted",
+            checksum="abc123",
+            success=False,
+            error="unexpected ')'",
+        )
+
+        insert_calls = [
+            c for c in mock_instance.execute.call_args_list if "INSERT" in str(c)
+        ]
+        sql, params = insert_calls[0][0]
+        assert "it's_quoted" not in sql
+        assert params == {
+            "version": 7,
+            "name": "it's_quoted",
+            "checksum": "abc123",
+            "success": False,
+            "error": "unexpected ')'",
+        }
+
 
 class TestIdempotency:
     def test_record_same_version_twice_is_idempotent(self, config: Config, mock_client):
@@ -474,6 +474,20 @@ class TestSchemaDifferNoChanges:
 
         assert changes == []
 
+    def test_diff_detects_changes_made_after_construction(self):
+        """Mutating a Table after construction is still picked up by diff."""
+        source = make_schema(make_table("events"))
+        target_table = make_table("events")
+        target_table.columns.append(Column(name="region", type="STRING"))
+        target_table.liquid_clustering.append("region")
+        target = make_schema(target_table)
+
+        differ = SchemaDiffer()
+        changes = differ.diff(source, target)
+
+        change_types = {c.change_type for c in changes}
+        assert change_types == {ChangeType.ADD_COLUMN, ChangeType.ALTER_CLUSTERING}
+
 
 class TestSchemaDifferIgnoresTables:
     """Tests for table filtering behavior."""
@@ -67,6 +67,9 @@ def make_mock_client(
     def fetchall_side_effect(sql: str):
         sql_lower = sql.lower()
         if "information_schema.tables" in sql_lower:
+            for d in tables_data or []:
+                if f"'{d['table_name']}'" in sql_lower:
+                    return [FakeRow(d)]
             return [FakeRow(d) for d in (tables_data or [])]
         elif "information_schema.columns" in sql_lower:
             return [FakeRow(d) for d in (columns_data or [])]
@@ -220,6 +223,18 @@ class TestIntrospectPrimaryKey:
         assert table.primary_key.columns == ["id"]
         assert table.primary_key.rely is True
 
+    def test_primary_key_join_is_scoped_to_table(self):
+        """PK rows must join constraint usage on schema and table, not name alone."""
+        client = make_mock_client(tables_data=[])
+        introspector = SchemaIntrospector(client, catalog="main", schema="default")
+
+        introspector._fetch_primary_key_rows()
+
+        sql = client.fetchall.call_args_list[0].args[0]
+        assert "tc.table_schema = ccu.table_schema" in sql
+        assert "tc.table_name = ccu.table_name" in sql
+        assert "ccu.column_name" in sql
+
 
 class TestIntrospectCheckConstraints:
     """Test introspecting CHECK constraints."""
@@ -301,6 +316,26 @@ class TestIntrospectLiquidClustering:
         assert table is not None
         assert table.liquid_clustering == ["event_date", "user_id"]
 
+    def test_introspect_liquid_clustering_json_array(self):
+        """Clustering columns reported as a JSON array should be parsed."""
+        client = make_mock_client(
+            tables_data=[
+                {
+                    "table_name": "events",
+                    "table_type": "MANAGED",
+                    "data_source_format": "DELTA",
+                    "comment": None,
+                    "clustering_columns": '["event_date", "user_id"]',
+                }
+            ],
+        )
+
+        introspector = SchemaIntrospector(client, catalog="main", schema="default")
+        table = introspector.introspect_table("events")
+
+        assert table is not None
+        assert table.liquid_clustering == ["event_date", "user_id"]
+
 
 class TestIntrospectIgnoresViews:
     """Test that views are ignored during introspection."""
@@ -517,3 +552,19 @@ class TestRowGetHelper:
         assert introspector._row_get(row, "table_type") == "MANAGED"
         assert introspector._row_get(row, "missing") is None
         assert introspector._row_get(row, "missing", "N/A") == "N/A"
+
+
+class TestFetchAllTableNames:
+    """Test that non-Delta tables are filtered server-side."""
+
+    def test_table_listing_filters_types_and_format_in_sql(self):
+        """Listing query should push table type and format filters into SQL."""
+        client = make_mock_client(tables_data=[])
+        introspector = SchemaIntrospector(client, catalog="main", schema="default")
+
+        introspector.introspect_schema()
+
+        sql = client.fetchall.call_args_list[0].args[0]
+        assert "table_type IN ('EXTERNAL', 'MANAGED')" in sql
+        assert "data_source_format IS NULL" in sql
+        assert "'DELTA'" in sql
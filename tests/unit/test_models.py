@@ -5,6 +5,7 @@ from ucmt.schema.models import (
     Column,
     ForeignKey,
     PrimaryKey,
+    Schema,
     Table,
 )
 
@@ -19,6 +20,14 @@ class TestModelsBasic:
         assert col.type == "BIGINT"
         assert col.nullable is True
 
+    def test_models_use_slots(self):
+        """Model instances have no per-instance __dict__."""
+        col = Column(name="id", type="BIGINT")
+        table = Table(name="users", columns=[col])
+        assert not hasattr(col, "__dict__")
+        assert not hasattr(table, "__dict__")
+        assert not hasattr(Schema(tables={"users": table}), "__dict__")
+
     def test_table_creation(self):
         """Table can be created with columns."""
         cols = [Column(name="id", type="BIGINT"), Column(name="name", type="STRING")]
@@ -26,6 +35,33 @@ class TestModelsBasic:
         assert table.name == "users"
         assert len(table.columns) == 2
 
+    def test_table_get_column(self):
+        """get_column looks up columns by name and returns None when missing."""
+        cols = [Column(name="id", type="BIGINT"), Column(name="name", type="STRING")]
+        table = Table(name="users", columns=cols)
+        assert table.get_column("name") is cols[1]
+        assert table.get_column("missing") is None
+
+    def test_table_columns_by_name(self):
+        """columns_by_name maps each column name to its Column."""
+        cols = [Column(name="id", type="BIGINT"), Column(name="name", type="STRING")]
+        table = Table(name="users", columns=cols)
+        assert table.columns_by_name == {"id": cols[0], "name": cols[1]}
+
+    def test_table_reflects_mutation_after_construction(self):
+        """get_column and equality see columns and clustering added later."""
+        table = Table(name="users", columns=[Column(name="id", type="BIGINT")])
+        original = Table(name="users", columns=[Column(name="id", type="BIGINT")])
+        email = Column(name="email", type="STRING")
+        table.columns.append(email)
+        assert table.get_column("email") is email
+        assert table != original
+
+        original.columns.append(Column(name="email", type="STRING"))
+        assert table == original
+        table.liquid_clustering.append("email")
+        assert table != original
+
     def test_primary_key_creation(self):
         """PrimaryKey can be created with columns and rely flag."""
         pk = PrimaryKey(columns=["id", "tenant_id"], rely=True)
@@ -78,6 +114,19 @@ class TestColumnOrderNotSignificant:
         table2 = Table(name="users", columns=cols2)
         assert table1 == table2
 
+    def test_tables_equal_with_clustering_in_different_order(self):
+        """Clustering and partitioning order is not significant for equality."""
+        cols = [Column(name="a", type="INT"), Column(name="b", type="INT")]
+        table1 = Table(
+            name="t", columns=cols, liquid_clustering=["a", "b"], partitioned_by=["a"]
+        )
+        table2 = Table(
+            name="t", columns=cols, liquid_clustering=["b", "a"], partitioned_by=["a"]
+        )
+        table3 = Table(name="t", columns=cols, liquid_clustering=["a"])
+        assert table1 == table2
+        assert table1 != table3
+
     def test_tables_not_equal_with_different_columns(self):
         """Tables with different columns are not equal."""
         cols1 = [Column(name="id", type="BIGINT")]
@@ -118,3 +167,60 @@ class TestTypeNormalizationCaseInsensitive:
         col = Column(name="amount", type="decimal(10,2)")
         assert col.type == "decimal(10,2)"
         assert col.normalized_type == "DECIMAL(10,2)"
+
+
+class TestSchemaTableNames:
+    """Tests for Schema.table_names view."""
+
+    def test_table_names_supports_set_operations(self):
+        """table_names() is set-like and reflects the tables dict."""
+        schema_a = Schema(tables={"a": Table(name="a", columns=[])})
+        schema_b = Schema(
+            tables={
+                "a": Table(name="a", columns=[]),
+                "b": Table(name="b", columns=[]),
+            }
+        )
+
+        assert schema_b.table_names() - schema_a.table_names() == {"b"}
+        assert schema_b.table_names() & schema_a.table_names() == {"a"}
+
+        schema_a.tables["c"] = Table(name="c", columns=[])
+        assert "c" in schema_a.table_names()
+
+
+class TestNameInterning:
+    """Tests for identifier interning on model construction."""
+
+    def test_column_and_table_names_are_interned(self):
+        """Equal names built at runtime share one string object."""
+        # Joining a list of characters builds a fresh string at runtime,
+        # defeating the compiler's interning of identical literals.
+        col_a = Column(name="".join(list("user_id")), type="BIGINT")
+        col_b = Column(name="".join(list("user_id")), type="BIGINT")
+        assert col_a.name is col_b.name
+
+        table = Table(name="".join(list("users")), columns=[col_a])
+        schema = Schema(tables={"".join(list("users")): table})
+        assert next(iter(schema.tables)) is table.name
+
+    def test_schema_keeps_callers_tables_dict(self):
+        """Schema interns keys in place, so later edits to the dict are seen."""
+        tables = {"users": Table(name="users", columns=[])}
+        schema = Schema(tables=tables)
+        assert schema.tables is tables
+
+        tables["orders"] = Table(name="orders", columns=[])
+        assert schema.get_table("orders") is tables["orders"]
+
+
+class TestSchemaGetColumn:
+    """Tests for cross-table column lookup on Schema."""
+
+    def test_get_column_by_table_and_column_name(self):
+        """Schema.get_column resolves (table, column) and returns None when missing."""
+        col = Column(name="id", type="BIGINT")
+        schema = Schema(tables={"users": Table(name="users", columns=[col])})
+        assert schema.get_column("users", "id") is col
+        assert schema.get_column("users", "missing") is None
+        assert schema.get_column("missing", "id") is None
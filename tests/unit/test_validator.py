@@ -1,5 +1,7 @@
 """TDD tests for SchemaValidator - written FIRST before implementation."""
 
+from dataclasses import asdict, fields
+
 from ucmt.schema.models import (
     CheckConstraint,
     Column,
@@ -306,6 +308,28 @@ class TestValidationIssueDataclass:
         assert issue.table == "orders"
         assert issue.column is None
 
+    def test_validation_issue_fields_include_message(self):
+        """message is a regular dataclass field, so asdict exposes it."""
+        issue = ValidationIssue(
+            table="t",
+            column=None,
+            kind="missing_table",
+            message="Table 't' not found in database",
+        )
+
+        assert [f.name for f in fields(ValidationIssue)] == [
+            "table",
+            "column",
+            "kind",
+            "message",
+        ]
+        assert asdict(issue) == {
+            "table": "t",
+            "column": None,
+            "kind": "missing_table",
+            "message": "Table 't' not found in database",
+        }
+
 
 class TestValidateConstraintMismatch:
     """Test validation detects constraint mismatches."""